@@ -12,6 +12,9 @@ from pathlib import Path
 class SmartSelector:
     """Generate resilient selectors that survive DOM changes"""
     
+    # Elements scanned by find_elements_batch
+    BATCH_CANDIDATES = 'button, a, [role=button]'
+    
     def __init__(self):
         """Initialize smart selector generator"""
         self.selector_cache_file = Path("selector_cache.json")
@@ -158,6 +161,40 @@ class SmartSelector:
         print(f"❌ Could not find element: {description}")
         return None
     
+    def find_elements_batch(self, page, descriptions: List[str]) -> Dict[str, any]:
+        """
+        Find several clickable elements by visible text in one round-trip.
+        
+        All descriptions are resolved by a single page.evaluate over the
+        candidate elements, instead of one multi-strategy lookup each.
+        
+        Args:
+            page: Playwright page object
+            descriptions: Visible text of the elements to find
+        
+        Returns:
+            Element locators keyed by description, for hits only
+        """
+        indices = page.evaluate("""({selector, descs}) => {
+            const all = Array.from(document.querySelectorAll(selector));
+            const results = {};
+            for (const d of descs) {
+                results[d] = all.findIndex(e => (e.innerText || '').trim().includes(d));
+            }
+            return results;
+        }""", {'selector': self.BATCH_CANDIDATES, 'descs': list(descriptions)})
+        
+        candidates = page.locator(self.BATCH_CANDIDATES)
+        found = {}
+        for description, index in indices.items():
+            if index >= 0:
+                found[description] = candidates.nth(index)
+                print(f"✅ Found via batch text match: {description}")
+            else:
+                print(f"❌ Could not find element: {description}")
+        
+        return found
+    
     def generate_resilient_selector(self, page, element) -> str:
         """
         Generate most resilient selector for an element.
@@ -17,6 +17,7 @@ from .playwright_automation import (
 
 from .webpilot_unified import (
     WebPilot,
+    BrowserPool,
     RealBrowserAutomation  # Backward compatibility alias
 )
 
@@ -59,6 +60,7 @@ __all__ = [
     # Playwright implementations
     'PlaywrightAutomation',
     'WebPilot',
+    'BrowserPool',
     'RealBrowserAutomation',  # Legacy name points to Playwright now!
     'quick_screenshot',
     'quick_page_text',
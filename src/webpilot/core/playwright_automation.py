@@ -19,6 +19,23 @@ import json
 import time
 
 
+# Lean Chromium flags for automation (opt in with lean_launch=True): no
+# extensions or background services, and /tmp instead of a small /dev/shm
+CHROMIUM_LAUNCH_ARGS = [
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-sync',
+    '--disable-features=Translate,BackForwardCache',
+    '--metrics-recording-only',
+    '--mute-audio',
+]
+
+# Added to lean launches only when headless, so headed runs keep WebGL
+CHROMIUM_HEADLESS_ARGS = ['--disable-gpu']
+
+
 class PlaywrightAutomation:
     """
     Modern browser automation using Playwright.
@@ -30,7 +47,9 @@ class PlaywrightAutomation:
         browser_type: str = 'firefox',
         headless: bool = False,
         slow_mo: int = 0,
-        timeout: int = 30000
+        timeout: int = 30000,
+        browser: Optional[Browser] = None,
+        lean_launch: bool = False
     ):
         """
         Initialize Playwright automation.
@@ -40,15 +59,21 @@ class PlaywrightAutomation:
             headless: Run without GUI
             slow_mo: Slow down operations by N milliseconds (useful for debugging)
             timeout: Default timeout for operations in milliseconds
+            browser: Already-launched browser to open a fresh context on instead
+                     of launching one (it is left running on close)
+            lean_launch: Launch Chromium with CHROMIUM_LAUNCH_ARGS (plus
+                         --disable-gpu when headless)
         """
         self.browser_type = browser_type
         self.headless = headless
         self.slow_mo = slow_mo
         self.default_timeout = timeout
+        self.lean_launch = lean_launch
 
         # Playwright instances
         self.playwright: Optional[Playwright] = None
-        self.browser: Optional[Browser] = None
+        self.browser: Optional[Browser] = browser
+        self._owns_browser = browser is None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
 
@@ -66,17 +91,28 @@ class PlaywrightAutomation:
             True if successful, False otherwise
         """
         try:
-            # Start Playwright (auto-handles driver installation!)
-            self.playwright = sync_playwright().start()
-
-            # Get browser launcher
-            browser_launcher = getattr(self.playwright, self.browser_type)
-
-            # Launch browser
-            self.browser = browser_launcher.launch(
-                headless=self.headless,
-                slow_mo=self.slow_mo
-            )
+            if self._owns_browser:
+                # Start Playwright (auto-handles driver installation!)
+                self.playwright = sync_playwright().start()
+
+                # Get browser launcher
+                browser_launcher = getattr(self.playwright, self.browser_type)
+
+                # Launch browser (Chromium with the lean flag set if asked)
+                launch_options = {}
+                if self.lean_launch and self.browser_type == 'chromium':
+                    args = list(CHROMIUM_LAUNCH_ARGS)
+                    if self.headless:
+                        args += CHROMIUM_HEADLESS_ARGS
+                    launch_options['args'] = args
+                self.browser = browser_launcher.launch(
+                    headless=self.headless,
+                    slow_mo=self.slow_mo,
+                    **launch_options
+                )
+            else:
+                # Shared browser: a new context is all this session costs
+                self.browser_type = self.browser.browser_type.name
 
             # Create context (like a session with cookies, storage, etc.)
             self.context = self.browser.new_context(
@@ -448,7 +484,7 @@ class PlaywrightAutomation:
         try:
             if self.context:
                 self.context.close()
-            if self.browser:
+            if self.browser and self._owns_browser:
                 self.browser.close()
             if self.playwright:
                 self.playwright.stop()
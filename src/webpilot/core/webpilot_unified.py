@@ -8,11 +8,66 @@ This provides the same high-level interface but uses Playwright internally.
 
 from pathlib import Path
 from typing import Dict, List, Optional, Any
+from contextlib import asynccontextmanager
+from playwright.async_api import async_playwright, Browser as AsyncBrowser, BrowserContext as AsyncBrowserContext
 from .playwright_automation import PlaywrightAutomation
+import asyncio
 import json
 import time
 
 
+class BrowserPool:
+    """
+    Fixed set of warm contexts on one async Playwright browser.
+
+    Contexts are handed out through an asyncio.Queue, so at most ``size``
+    pages load at once and each context serves one page at a time.
+    """
+
+    def __init__(
+        self,
+        browser: AsyncBrowser,
+        size: int = 4,
+        **context_options
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            browser: Launched async Playwright browser
+            size: Number of contexts to keep open
+            **context_options: Passed to browser.new_context()
+        """
+        self.browser = browser
+        self.size = size
+        self.context_options = context_options
+        self._contexts: List[AsyncBrowserContext] = []
+        self._queue: Optional[asyncio.Queue] = None
+
+    async def start(self):
+        """Open all contexts up front."""
+        self._queue = asyncio.Queue()
+        for _ in range(self.size):
+            context = await self.browser.new_context(**self.context_options)
+            self._contexts.append(context)
+            self._queue.put_nowait(context)
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Borrow a context, waiting if all are busy."""
+        context = await self._queue.get()
+        try:
+            yield context
+        finally:
+            self._queue.put_nowait(context)
+
+    async def close(self):
+        """Close every context (the browser is left to its owner)."""
+        for context in self._contexts:
+            await context.close()
+        self._contexts.clear()
+
+
 class WebPilot:
     """
     Unified WebPilot interface with Playwright backend.
@@ -23,7 +78,8 @@ class WebPilot:
         self,
         browser: str = 'firefox',
         headless: bool = True,
-        slow_mo: int = 0
+        slow_mo: int = 0,
+        pool_size: int = 4
     ):
         """
         Initialize WebPilot with Playwright backend.
@@ -32,97 +88,160 @@ class WebPilot:
             browser: 'firefox', 'chromium', or 'webkit'
             headless: Run without GUI
             slow_mo: Slow down operations (debugging)
+            pool_size: Contexts used to check URLs concurrently
         """
         self.browser_type = browser
         self.headless = headless
         self.slow_mo = slow_mo
+        self.pool_size = pool_size
         self.automation: Optional[PlaywrightAutomation] = None
         self.results_dir = Path("results")
         self.results_dir.mkdir(exist_ok=True)
+        self.screenshots_dir = Path("screenshots")
 
     def check_website_status(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
         """
         Check if websites are accessible (core WebPilot feature).
 
+        URLs are checked concurrently on one browser through a pool of
+        ``pool_size`` warm contexts. From inside a running event loop
+        (e.g. an async server or Jupyter), await
+        check_website_status_async() instead.
+
         Args:
             urls: List of URLs to check
 
         Returns:
             Dictionary with status for each URL
+
+        Raises:
+            RuntimeError: If called while an event loop is running
         """
-        results = {}
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.check_website_status_async(urls))
 
-        # Start browser
-        self.automation = PlaywrightAutomation(
-            browser_type=self.browser_type,
-            headless=self.headless,
-            slow_mo=self.slow_mo
+        raise RuntimeError(
+            "check_website_status() cannot run inside an event loop; "
+            "use 'await check_website_status_async(urls)' instead"
         )
 
-        if not self.automation.start():
-            return {url: {'status': 'ERROR', 'error': 'Failed to start browser'} for url in urls}
+    async def check_website_status_async(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Async variant of check_website_status() for use in a running loop.
 
-        # Check each URL
-        for url in urls:
-            try:
-                print(f"\n🔍 Checking {url}...")
+        Args:
+            urls: List of URLs to check
 
-                # Navigate
-                success = self.automation.navigate(url)
+        Returns:
+            Dictionary with status for each URL
+        """
+        try:
+            results = await self._check_urls_pooled(urls)
+        except Exception as e:
+            print(f"❌ Failed to start browser: {e}")
+            print("💡 Try running: playwright install")
+            return {url: {'status': 'ERROR', 'error': f'Failed to start browser: {e}'} for url in urls}
 
-                if success:
-                    # Get page info
-                    title = self.automation.get_title()
-                    current_url = self.automation.get_url()
+        # Save results
+        results_file = self.results_dir / 'site_status.json'
+        with open(results_file, 'w') as f:
+            json.dump(results, f, indent=2)
 
-                    # Take screenshot for proof
-                    clean_name = url.replace('https://', '').replace('http://', '').replace('/', '_')
-                    screenshot = self.automation.screenshot(clean_name)
+        print(f"\n📊 Results saved to {results_file}")
+        return results
 
-                    # Get basic page stats
-                    stats = self.automation.execute_script("""() => ({
-                        links: document.querySelectorAll('a').length,
-                        images: document.querySelectorAll('img').length,
-                        scripts: document.querySelectorAll('script').length
-                    })""")
+    async def _check_urls_pooled(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Launch one browser and check every URL through a BrowserPool."""
+        async with async_playwright() as p:
+            launcher = getattr(p, self.browser_type)
+            browser = await launcher.launch(headless=self.headless, slow_mo=self.slow_mo)
+            pool = BrowserPool(
+                browser,
+                size=min(self.pool_size, max(len(urls), 1)),
+                viewport={'width': 1366, 'height': 768},
+                user_agent='Mozilla/5.0 (X11; Linux x86_64) WebPilot/2.0'
+            )
+            try:
+                await pool.start()
+                statuses = await asyncio.gather(
+                    *(self._check_url(pool, url) for url in urls)
+                )
+            finally:
+                await pool.close()
+                await browser.close()
+
+        return dict(zip(urls, statuses))
+
+    async def _check_url(self, pool: 'BrowserPool', url: str) -> Dict[str, Any]:
+        """Check one URL on a pooled context."""
+        print(f"\n🔍 Checking {url}...")
+
+        async with pool.acquire() as context:
+            page = await context.new_page()
+            try:
+                # Add protocol if missing
+                target = url if url.startswith(('http://', 'https://')) else f'https://{url}'
 
-                    results[url] = {
-                        'status': 'UP',
-                        'title': title,
-                        'url': current_url,
-                        'screenshot': str(screenshot) if screenshot else None,
-                        'stats': stats or {},
+                try:
+                    # Short timeout so one hanging site can't hold a pooled context
+                    response = await page.goto(target, wait_until='domcontentloaded', timeout=5000)
+                except Exception as e:
+                    print(f"  ❌ {url} is DOWN")
+                    return {
+                        'status': 'DOWN',
+                        'error': f'Failed to navigate: {e}',
                         'timestamp': time.time()
                     }
 
-                    print(f"  ✅ {url} is UP - Title: {title[:50]}...")
+                # Get page info
+                try:
+                    title = await page.title()
+                except Exception:
+                    title = ""
 
-                else:
-                    results[url] = {
-                        'status': 'DOWN',
-                        'error': 'Failed to navigate',
-                        'timestamp': time.time()
-                    }
-                    print(f"  ❌ {url} is DOWN")
+                # Take screenshot for proof
+                clean_name = url.replace('https://', '').replace('http://', '').replace('/', '_')
+                try:
+                    self.screenshots_dir.mkdir(exist_ok=True)
+                    screenshot = self.screenshots_dir / f"{clean_name}.png"
+                    await page.screenshot(path=str(screenshot))
+                except Exception as e:
+                    print(f"  ⚠️  Screenshot failed for {url}: {e}")
+                    screenshot = None
+
+                # Get basic page stats
+                try:
+                    stats = await page.evaluate("""() => ({
+                        links: document.querySelectorAll('a').length,
+                        images: document.querySelectorAll('img').length,
+                        scripts: document.querySelectorAll('script').length
+                    })""")
+                except Exception as e:
+                    print(f"  ⚠️  Page stats failed for {url}: {e}")
+                    stats = None
+
+                print(f"  ✅ {url} is UP - Title: {title[:50]}...")
+                return {
+                    'status': 'UP',
+                    'title': title,
+                    'url': page.url,
+                    'http_status': response.status if response else None,
+                    'screenshot': str(screenshot) if screenshot else None,
+                    'stats': stats or {},
+                    'timestamp': time.time()
+                }
 
             except Exception as e:
-                results[url] = {
+                print(f"  ❌ {url} ERROR: {e}")
+                return {
                     'status': 'ERROR',
                     'error': str(e),
                     'timestamp': time.time()
                 }
-                print(f"  ❌ {url} ERROR: {e}")
-
-        # Close browser
-        self.automation.close()
-
-        # Save results
-        results_file = self.results_dir / 'site_status.json'
-        with open(results_file, 'w') as f:
-            json.dump(results, f, indent=2)
-
-        print(f"\n📊 Results saved to {results_file}")
-        return results
+            finally:
+                await page.close()
 
     def test_web_app(self, url: str, test_sequence: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -4,6 +4,7 @@ Dev Server Integration - Auto-detect and connect to development servers
 Supports: Vite, Next.js, Create React App, Vue CLI, Webpack Dev Server, Parcel, and more
 """
 
+import asyncio
 import socket
 import time
 import requests
@@ -61,6 +62,62 @@ class DevServer:
         self.detected_servers = detected
         return detected
     
+    async def scan_ports_async(
+        self,
+        ports: Optional[List[int]] = None,
+        timeout: float = 0.25
+    ) -> List[Dict]:
+        """
+        Scan for running dev servers, probing all ports concurrently.
+        
+        Total scan time is that of the slowest single probe rather than
+        the sum of every probe, which matters when most ports are closed.
+        
+        Args:
+            ports: List of ports to scan (None = scan all common ports)
+            timeout: Connect timeout per port in seconds
+            
+        Returns:
+            List of detected servers with details
+        """
+        if ports is None:
+            ports = list(self.COMMON_PORTS.keys())
+        
+        open_flags = await asyncio.gather(
+            *(self._is_port_open_async(port, timeout) for port in ports)
+        )
+        open_ports = [port for port, is_open in zip(ports, open_flags) if is_open]
+        
+        # Only open ports get an HTTP request for framework fingerprinting
+        infos = await asyncio.gather(
+            *(asyncio.to_thread(self._identify_server, port) for port in open_ports)
+        )
+        
+        detected = []
+        for port, server_info in zip(open_ports, infos):
+            if server_info:
+                detected.append(server_info)
+                print(f"✅ Found {server_info['framework']} on port {port}")
+        
+        self.detected_servers = detected
+        return detected
+    
+    async def _is_port_open_async(self, port: int, timeout: float = 0.25) -> bool:
+        """Check if a port is open without blocking the event loop"""
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, port), timeout=timeout
+            )
+        except (OSError, asyncio.TimeoutError):
+            return False
+        
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
+    
     def _is_port_open(self, port: int, timeout: float = 0.5) -> bool:
         """Check if a port is open"""
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
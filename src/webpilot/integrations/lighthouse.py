@@ -11,6 +11,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+import requests
+
 
 class LighthouseAudit:
     """Run Lighthouse audits via Playwright"""
@@ -24,6 +26,9 @@ class LighthouseAudit:
         'pwa'
     ]
     
+    # PageSpeed Insights (hosted Lighthouse) endpoint
+    PSI_ENDPOINT = "https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
+    
     # Score thresholds
     SCORE_EXCELLENT = 90
     SCORE_GOOD = 50
@@ -35,13 +40,20 @@ class LighthouseAudit:
         self.reports_dir.mkdir(exist_ok=True)
         self.baseline_scores: Dict[str, Dict] = {}
     
-    def run(self, url: str, categories: Optional[List[str]] = None) -> Dict[str, Any]:
+    def run(
+        self,
+        url: str,
+        categories: Optional[List[str]] = None,
+        port: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Run Lighthouse audit on URL.
         
         Args:
             url: URL to audit
             categories: Categories to audit (None = all)
+            port: Remote debugging port of an already running Chromium to
+                  audit with, instead of launching a fresh one
             
         Returns:
             Audit results with scores
@@ -53,7 +65,7 @@ class LighthouseAudit:
         
         try:
             # Run Lighthouse via CLI
-            result = self._run_lighthouse_cli(url, categories)
+            result = self._run_lighthouse_cli(url, categories, port)
             
             if result:
                 print(f"\n📊 Lighthouse Scores:")
@@ -71,7 +83,12 @@ class LighthouseAudit:
             print(f"❌ Error running Lighthouse: {e}")
             return {}
     
-    def _run_lighthouse_cli(self, url: str, categories: List[str]) -> Optional[Dict]:
+    def _run_lighthouse_cli(
+        self,
+        url: str,
+        categories: List[str],
+        port: Optional[int] = None
+    ) -> Optional[Dict]:
         """Run Lighthouse via CLI and parse JSON output"""
         try:
             # Create temp file for output
@@ -84,10 +101,15 @@ class LighthouseAudit:
                 url,
                 '--output=json',
                 f'--output-path={tmp_path}',
-                '--quiet',
-                '--chrome-flags=--headless'
+                '--quiet'
             ]
             
+            # Attach to a running Chromium or launch a headless one
+            if port:
+                cmd.append(f'--port={port}')
+            else:
+                cmd.append('--chrome-flags=--headless')
+            
             # Add category flags
             for category in categories:
                 cmd.append(f'--only-categories={category}')
@@ -115,6 +137,54 @@ class LighthouseAudit:
             print(f"❌ Error running Lighthouse CLI: {e}")
             return None
     
+    def audit_via_psi(
+        self,
+        url: str,
+        categories: Optional[List[str]] = None,
+        api_key: Optional[str] = None,
+        strategy: str = 'mobile'
+    ) -> Dict[str, Any]:
+        """
+        Run Lighthouse through the PageSpeed Insights API.
+        
+        No local browser is launched; the audit runs on Google's servers, so
+        the URL must be publicly reachable.
+        
+        Args:
+            url: URL to audit
+            categories: Categories to audit (None = performance only)
+            api_key: Optional PageSpeed Insights API key
+            strategy: 'mobile' or 'desktop'
+            
+        Returns:
+            Audit results with scores, in the same shape as run()
+        """
+        if categories is None:
+            categories = ['performance']
+        
+        params = [('url', url), ('strategy', strategy)]
+        params += [('category', c.upper().replace('-', '_')) for c in categories]
+        if api_key:
+            params.append(('key', api_key))
+        
+        print(f"🔍 Running PageSpeed Insights audit on {url}...")
+        
+        try:
+            response = requests.get(self.PSI_ENDPOINT, params=params, timeout=120)
+            response.raise_for_status()
+            data = response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"❌ PageSpeed Insights request failed: {e}")
+            return {}
+        
+        result = self._parse_lighthouse_output(data.get('lighthouseResult', {}))
+        
+        print(f"\n📊 Lighthouse Scores:")
+        self._print_scores(result)
+        self._save_report(url, result)
+        
+        return result
+    
     def _parse_lighthouse_output(self, data: Dict) -> Dict[str, Any]:
         """Parse Lighthouse JSON output into structured results"""
         categories = data.get('categories', {})
@@ -259,9 +329,9 @@ class LighthouseAudit:
         """Run comprehensive audit on all categories"""
         return self.run(url, self.CATEGORIES)
     
-    def audit_performance_only(self, url: str) -> Dict:
+    def audit_performance_only(self, url: str, port: Optional[int] = None) -> Dict:
         """Quick performance-only audit"""
-        return self.run(url, ['performance'])
+        return self.run(url, ['performance'], port)
     
     def audit_accessibility_only(self, url: str) -> Dict:
         """Accessibility-only audit"""
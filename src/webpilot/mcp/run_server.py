@@ -48,7 +48,7 @@ class MCPProtocolHandler:
             
             elif method == "tools/list":
                 # List available tools
-                tools = [tool.to_dict() for tool in self.server.get_tools()]
+                tools = self.server.get_tool_dicts()
                 response = {"tools": tools}
             
             elif method == "tools/call":
@@ -73,6 +73,11 @@ class WebPilotMCPServer:
         self.logger = get_logger(__name__)
         self.resources = WebPilotResources()
         
+        # Tool catalogs are static, so they are built on first use only
+        self._tools_cached: Optional[List[MCPTool]] = None
+        self._tools_dict_cached: Optional[List[Dict[str, Any]]] = None
+        self._extended_tools_cached: Optional[List[MCPTool]] = None
+        
     def get_tools(self) -> List[MCPTool]:
         """
         Get available MCP tools.
@@ -80,6 +85,23 @@ class WebPilotMCPServer:
         Returns:
             List of available tools for web automation
         """
+        if self._tools_cached is None:
+            self._tools_cached = self._build_tools()
+        return list(self._tools_cached)
+    
+    def get_tool_dicts(self) -> List[Dict[str, Any]]:
+        """
+        Get available MCP tools in wire format, serialized once.
+        
+        Returns:
+            List of tool dictionaries as sent for tools/list
+        """
+        if self._tools_dict_cached is None:
+            self._tools_dict_cached = [tool.to_dict() for tool in self.get_tools()]
+        return self._tools_dict_cached
+    
+    def _build_tools(self) -> List[MCPTool]:
+        """Build the basic tool definitions."""
         return [
             MCPTool(
                 name="webpilot_start",
@@ -531,6 +553,12 @@ class WebPilotMCPServer:
         Returns:
             List of extended tools
         """
+        if self._extended_tools_cached is None:
+            self._extended_tools_cached = self._build_extended_tools()
+        return list(self._extended_tools_cached)
+    
+    def _build_extended_tools(self) -> List[MCPTool]:
+        """Convert the extended tool catalog to MCP tools."""
         extended_tools = []
         
         # Get all extended tools
@@ -572,9 +600,7 @@ class WebPilotMCPServer:
         Returns:
             Complete list of MCP tools
         """
-        all_tools = self.get_tools()  # Basic tools
-        all_tools.extend(self.get_extended_tools())  # Extended tools
-        return all_tools
+        return self.get_tools() + self.get_extended_tools()
     
     def _handle_cloud_session(self, platform: CloudPlatform, args: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -6,6 +6,7 @@ This module defines all the tools available through the MCP interface.
 
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
+import functools
 import json
 
 
@@ -25,9 +26,12 @@ class WebPilotTools:
     WebPilot tools available through MCP.
     
     This class defines all WebPilot capabilities as MCP tools.
+    Tool definitions are built once and shared between callers, so treat
+    the returned dictionaries as read-only.
     """
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_browser_control_tools() -> List[Dict[str, Any]]:
         """Get browser control tools."""
         return [
@@ -77,6 +81,7 @@ class WebPilotTools:
         ]
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_interaction_tools() -> List[Dict[str, Any]]:
         """Get page interaction tools."""
         return [
@@ -141,6 +146,7 @@ class WebPilotTools:
         ]
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_extraction_tools() -> List[Dict[str, Any]]:
         """Get data extraction tools."""
         return [
@@ -185,6 +191,7 @@ class WebPilotTools:
         ]
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_validation_tools() -> List[Dict[str, Any]]:
         """Get validation and testing tools."""
         return [
@@ -231,6 +238,7 @@ class WebPilotTools:
         ]
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_utility_tools() -> List[Dict[str, Any]]:
         """Get utility tools."""
         return [
@@ -276,26 +284,34 @@ class WebPilotTools:
             }
         ]
     
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _catalog(cls) -> tuple:
+        """Build the full catalog once: (all tools, by name, by category)."""
+        all_tools = (
+            cls.get_browser_control_tools()
+            + cls.get_interaction_tools()
+            + cls.get_extraction_tools()
+            + cls.get_validation_tools()
+            + cls.get_utility_tools()
+        )
+        by_name = {tool["name"]: tool for tool in reversed(all_tools)}
+        by_category: Dict[str, List[Dict[str, Any]]] = {}
+        for tool in all_tools:
+            by_category.setdefault(tool.get("category"), []).append(tool)
+        return all_tools, by_name, by_category
+    
     @classmethod
     def get_all_tools(cls) -> List[Dict[str, Any]]:
         """Get all available tools."""
-        all_tools = []
-        all_tools.extend(cls.get_browser_control_tools())
-        all_tools.extend(cls.get_interaction_tools())
-        all_tools.extend(cls.get_extraction_tools())
-        all_tools.extend(cls.get_validation_tools())
-        all_tools.extend(cls.get_utility_tools())
-        return all_tools
+        return list(cls._catalog()[0])
     
     @classmethod
     def get_tool_by_name(cls, name: str) -> Optional[Dict[str, Any]]:
         """Get a specific tool by name."""
-        for tool in cls.get_all_tools():
-            if tool["name"] == name:
-                return tool
-        return None
+        return cls._catalog()[1].get(name)
     
     @classmethod
     def get_tools_by_category(cls, category: str) -> List[Dict[str, Any]]:
         """Get tools by category."""
-        return [tool for tool in cls.get_all_tools() if tool.get("category") == category]
\ No newline at end of file
+        return list(cls._catalog()[2].get(category, []))
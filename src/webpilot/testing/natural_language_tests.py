@@ -7,6 +7,7 @@ Supports multiple test frameworks and languages.
 
 import json
 import re
+import time
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
@@ -913,6 +914,7 @@ class SmartTestRecorder:
         self.pilot = pilot or WebPilot()
         self.recording = []
         self.is_recording = False
+        self.logger = get_logger(__name__)
         
     def start_recording(self):
         """Start recording user interactions."""
@@ -928,12 +930,19 @@ class SmartTestRecorder:
         
     def record_action(self, action_type: str, **kwargs):
         """Record a single action."""
+        self.record_batch([{'type': action_type, **kwargs}])
+        
+    def record_batch(self, actions: List[Dict[str, Any]]):
+        """
+        Record several actions in one call.
+        
+        Args:
+            actions: Action dicts, each with a 'type' key plus its arguments
+                     (e.g. {'type': 'click', 'text': 'Login'})
+        """
         if self.is_recording:
-            self.recording.append({
-                'type': action_type,
-                'timestamp': time.time(),
-                **kwargs
-            })
+            timestamp = time.time()
+            self.recording.extend({'timestamp': timestamp, **action} for action in actions)
             
     def generate_test_from_recording(
         self,
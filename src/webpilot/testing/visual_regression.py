@@ -6,6 +6,7 @@ Detects pixel-perfect differences in web pages
 
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
+import hashlib
 import json
 from datetime import datetime
 
@@ -16,10 +17,28 @@ except ImportError:
     PIL_AVAILABLE = False
     print("⚠️  PIL not available. Install with: pip install pillow")
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# Tag/class outline of the DOM; ignores text and inline styles that animate
+STRUCTURE_JS = """
+    () => Array.from(
+        document.querySelectorAll('body *'),
+        el => el.tagName + '.' + (el.getAttribute('class') || '')
+    ).join('|')
+"""
+
 
 class VisualRegression:
     """Visual regression testing with screenshot comparison"""
     
+    # Longest side of the grayscale images compared in perceptual mode
+    PERCEPTUAL_SIZE = 512
+    
     def __init__(self, baseline_dir: str = "visual_baselines", diff_dir: str = "visual_diffs"):
         """
         Initialize visual regression tester.
@@ -36,6 +55,9 @@ class VisualRegression:
         # Metadata file
         self.metadata_file = self.baseline_dir / "metadata.json"
         self.metadata = self._load_metadata()
+        
+        # DOM hashes seen by the last compare, applied by approve_changes()
+        self._current_dom_hashes: Dict[str, str] = {}
     
     def _load_metadata(self) -> Dict:
         """Load baseline metadata"""
@@ -49,6 +71,37 @@ class VisualRegression:
         with open(self.metadata_file, 'w') as f:
             json.dump(self.metadata, f, indent=2)
     
+    def _dom_hash(self, page) -> str:
+        """Hash the page's DOM structure (tags and classes only)"""
+        return hashlib.sha256(page.evaluate(STRUCTURE_JS).encode()).hexdigest()
+    
+    @staticmethod
+    def _phash(image: Image.Image) -> Optional[str]:
+        """
+        64-bit perceptual hash (DCT of a 32x32 grayscale thumbnail).
+        
+        Returns:
+            Hash as 16 hex digits, or None without numpy
+        """
+        if not NUMPY_AVAILABLE:
+            return None
+        
+        pixels = np.asarray(image.convert('L').resize((32, 32), Image.LANCZOS), dtype=np.float64)
+        
+        # 2-D DCT-II as two matrix products
+        k = np.arange(32)
+        dct = np.cos(np.pi * (2 * k[None, :] + 1) * k[:, None] / 64)
+        low = (dct @ pixels @ dct.T)[:8, :8].flatten()
+        
+        # Compare low frequencies (DC term excluded) with their median
+        bits = low > np.median(low[1:])
+        return f"{int(''.join('1' if b else '0' for b in bits), 2):016x}"
+    
+    @staticmethod
+    def _hamming(a: str, b: str) -> int:
+        """Number of differing bits between two hex hashes"""
+        return bin(int(a, 16) ^ int(b, 16)).count('1')
+    
     def take_baseline(self, name: str, page, full_page: bool = True) -> str:
         """
         Take baseline screenshot for future comparisons.
@@ -68,13 +121,18 @@ class VisualRegression:
         # Take screenshot
         page.screenshot(path=str(filepath), full_page=full_page)
         
+        # Perceptual hash lets unchanged pages skip the full comparison
+        phash = self._phash(Image.open(filepath)) if PIL_AVAILABLE else None
+        
         # Save metadata
         self.metadata[name] = {
             'filename': filename,
             'created_at': datetime.now().isoformat(),
             'full_page': full_page,
             'url': page.url,
-            'viewport': page.viewport_size
+            'viewport': page.viewport_size,
+            'dom_hash': self._dom_hash(page),
+            'phash': phash
         }
         self._save_metadata()
         
@@ -86,16 +144,27 @@ class VisualRegression:
         name: str,
         page,
         threshold: float = 0.1,
-        full_page: bool = True
+        full_page: bool = True,
+        mode: str = 'pixel',
+        ssim_threshold: float = 0.98
     ) -> Dict:
         """
         Compare current page with baseline.
         
+        In 'perceptual' mode the screenshots are compared by SSIM on
+        downscaled grayscale copies, and a difference only counts as a
+        regression when the DOM structure changed as well. This ignores
+        anti-aliasing and frame-timing noise, e.g. on WebGL canvases.
+        When the current screenshot's perceptual hash equals the
+        baseline's, the baseline is not decoded at all.
+        
         Args:
             name: Name of baseline to compare with
             page: Playwright page object
-            threshold: Acceptable difference threshold (%)
+            threshold: Acceptable difference threshold (%), pixel mode
             full_page: Take full page screenshot
+            mode: 'pixel' or 'perceptual'
+            ssim_threshold: Minimum SSIM (0-1) to match, perceptual mode
             
         Returns:
             Comparison results
@@ -106,6 +175,18 @@ class VisualRegression:
                 'error': 'PIL not available. Install with: pip install pillow'
             }
         
+        if mode not in ('pixel', 'perceptual'):
+            return {
+                'success': False,
+                'error': f'Unknown comparison mode "{mode}". Use "pixel" or "perceptual"'
+            }
+        
+        if mode == 'perceptual' and not NUMPY_AVAILABLE:
+            return {
+                'success': False,
+                'error': 'numpy not available. Install with: pip install numpy'
+            }
+        
         # Check if baseline exists
         if name not in self.metadata:
             return {
@@ -118,13 +199,39 @@ class VisualRegression:
         current_path = self.diff_dir / current_filename
         page.screenshot(path=str(current_path), full_page=full_page)
         
-        # Load images
+        # Load images (decoding is lazy until pixels are accessed)
         baseline_path = self.baseline_dir / self.metadata[name]['filename']
         baseline_img = Image.open(baseline_path)
         current_img = Image.open(current_path)
         
         # Compare
-        result = self._compare_images(baseline_img, current_img, name, threshold)
+        if mode == 'perceptual':
+            dom_hash = self._dom_hash(page)
+            self._current_dom_hashes[name] = dom_hash
+            dom_changed = dom_hash != self.metadata[name].get('dom_hash')
+            
+            # Identical perceptual hashes: match without decoding the baseline
+            baseline_phash = self.metadata[name].get('phash')
+            current_phash = self._phash(current_img)
+            if baseline_phash and baseline_phash == current_phash:
+                result = {
+                    'success': True,
+                    'mode': 'perceptual',
+                    'match': True,
+                    'phash_distance': 0,
+                    'dom_changed': dom_changed,
+                    'difference_pct': 0.0,
+                    'diff_path': None,
+                    'current_size': current_img.size
+                }
+            else:
+                result = self._compare_perceptual(
+                    baseline_img, current_img, name, ssim_threshold, dom_changed
+                )
+                if baseline_phash:
+                    result['phash_distance'] = self._hamming(baseline_phash, current_phash)
+        else:
+            result = self._compare_images(baseline_img, current_img, name, threshold)
         
         # Print result
         if result['match']:
@@ -189,6 +296,83 @@ class VisualRegression:
             'current_size': current.size
         }
     
+    def _compare_perceptual(
+        self,
+        baseline: Image.Image,
+        current: Image.Image,
+        name: str,
+        ssim_threshold: float,
+        dom_changed: bool
+    ) -> Dict:
+        """
+        Compare two images by structural similarity.
+        
+        Returns:
+            Comparison results; difference_pct is (1 - SSIM) * 100
+        """
+        # Downscale both to the same small grayscale size
+        scale = self.PERCEPTUAL_SIZE / max(baseline.size)
+        size = baseline.size
+        if scale < 1:
+            size = (max(int(baseline.width * scale), 1), max(int(baseline.height * scale), 1))
+        
+        a = np.asarray(baseline.convert('L').resize(size, Image.BILINEAR), dtype=np.float64)
+        b = np.asarray(current.convert('L').resize(size, Image.BILINEAR), dtype=np.float64)
+        ssim = self._ssim(a, b)
+        
+        # Pixel noise alone is not a regression; the structure must change too
+        match = ssim >= ssim_threshold or not dom_changed
+        
+        diff_path = None
+        if not match:
+            baseline_rgb = baseline.convert('RGB')
+            current_rgb = current.convert('RGB')
+            if current_rgb.size != baseline_rgb.size:
+                current_rgb = current_rgb.resize(baseline_rgb.size, Image.LANCZOS)
+            diff = ImageChops.difference(baseline_rgb, current_rgb)
+            diff_path = self._create_diff_image(baseline_rgb, current_rgb, diff, name)
+        
+        return {
+            'success': True,
+            'mode': 'perceptual',
+            'match': match,
+            'ssim': ssim,
+            'ssim_threshold': ssim_threshold,
+            'dom_changed': dom_changed,
+            'difference_pct': (1 - ssim) * 100,
+            'diff_path': diff_path,
+            'baseline_size': baseline.size,
+            'current_size': current.size
+        }
+    
+    @staticmethod
+    def _ssim(a: "np.ndarray", b: "np.ndarray", block: int = 8) -> float:
+        """
+        Mean SSIM over non-overlapping blocks of two grayscale arrays.
+        
+        Returns:
+            Similarity in [-1, 1]; 1 means identical
+        """
+        c1 = (0.01 * 255) ** 2
+        c2 = (0.03 * 255) ** 2
+        
+        h = a.shape[0] // block * block
+        w = a.shape[1] // block * block
+        if h == 0 or w == 0:
+            return 1.0 if np.array_equal(a, b) else 0.0
+        
+        def blocks(x):
+            x = x[:h, :w].reshape(h // block, block, w // block, block)
+            return x.swapaxes(1, 2).reshape(-1, block * block)
+        
+        x, y = blocks(a), blocks(b)
+        mx, my = x.mean(axis=1), y.mean(axis=1)
+        vx, vy = x.var(axis=1), y.var(axis=1)
+        cov = ((x - mx[:, None]) * (y - my[:, None])).mean(axis=1)
+        
+        ssim = ((2 * mx * my + c1) * (2 * cov + c2)) / ((mx ** 2 + my ** 2 + c1) * (vx + vy + c2))
+        return float(ssim.mean())
+    
     def _create_diff_image(
         self,
         baseline: Image.Image,
@@ -268,6 +452,9 @@ class VisualRegression:
         
         # Update metadata
         self.metadata[name]['updated_at'] = datetime.now().isoformat()
+        self.metadata[name]['phash'] = self._phash(current_img)
+        if name in self._current_dom_hashes:
+            self.metadata[name]['dom_hash'] = self._current_dom_hashes.pop(name)
         self._save_metadata()
         
         print(f"✅ Baseline updated for '{name}'")
@@ -5,10 +5,11 @@ This module provides error handling utilities including retry logic,
 error recovery, and detailed error reporting.
 """
 
+import asyncio
 import functools
 import time
 import traceback
-from typing import Any, Callable, Optional, Type, TypeVar, Union, List
+from typing import Any, Callable, Optional, Type, TypeVar, Union, List, Tuple, NamedTuple
 from datetime import datetime
 import logging
 
@@ -148,6 +149,71 @@ class ErrorHandler:
         }
 
 
+@functools.lru_cache(maxsize=128)
+def _compute_schedule(max_attempts: int, delay: float, backoff: float) -> Tuple[float, ...]:
+    """
+    Compute the sleep schedule for a retry policy.
+    
+    Entry ``i`` is the delay after failed attempt ``i + 1``. Schedules are
+    cached so every function wrapped with the same policy shares one tuple.
+    
+    Args:
+        max_attempts: Maximum number of retry attempts
+        delay: Initial delay between retries in seconds
+        backoff: Backoff multiplier for delay
+        
+    Returns:
+        Tuple of delays, one per retry
+    """
+    return tuple(delay * backoff ** i for i in range(max(max_attempts - 1, 0)))
+
+
+class _RetryConfig(NamedTuple):
+    """Resolved retry policy shared by the retry decorators."""
+    max_attempts: int
+    schedule: Tuple[float, ...]
+    exceptions: tuple
+    on_retry: Optional[Callable]
+
+
+def _run_with_retry(func: Callable[..., T], args: tuple, kwargs: dict, cfg: _RetryConfig) -> T:
+    """
+    Call ``func`` under a retry policy.
+    
+    Args:
+        func: Function to call
+        args: Positional arguments for ``func``
+        kwargs: Keyword arguments for ``func``
+        cfg: Resolved retry policy
+        
+    Returns:
+        Result of the first successful call
+    """
+    max_attempts = cfg.max_attempts
+    schedule = cfg.schedule
+    on_retry = cfg.on_retry
+    sleep = time.sleep
+    
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return func(*args, **kwargs)
+        except cfg.exceptions as e:
+            if attempt == max_attempts:
+                logger.error(
+                    f"Max retries ({max_attempts}) exceeded for {func.__name__}"
+                )
+                raise
+            
+            logger.warning(
+                f"Attempt {attempt}/{max_attempts} failed for {func.__name__}: {e}"
+            )
+            
+            if on_retry:
+                on_retry(attempt, e)
+            
+            sleep(schedule[attempt - 1])
+
+
 def retry(
     max_attempts: int = 3,
     delay: float = 1.0,
@@ -168,34 +234,96 @@ def retry(
     Returns:
         Decorated function with retry logic
     """
+    cfg = _RetryConfig(
+        max_attempts,
+        _compute_schedule(max_attempts, delay, backoff),
+        exceptions,
+        on_retry
+    )
+    
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> T:
-            attempt = 1
-            current_delay = delay
+            return _run_with_retry(func, args, kwargs, cfg)
+        
+        return wrapper
+    return decorator
+
+
+async def _arun_with_retry(func: Callable[..., Any], args: tuple, kwargs: dict, cfg: _RetryConfig) -> Any:
+    """
+    Await ``func`` under a retry policy without blocking the event loop.
+    
+    Args:
+        func: Coroutine function to call
+        args: Positional arguments for ``func``
+        kwargs: Keyword arguments for ``func``
+        cfg: Resolved retry policy
+        
+    Returns:
+        Result of the first successful call
+    """
+    max_attempts = cfg.max_attempts
+    schedule = cfg.schedule
+    on_retry = cfg.on_retry
+    
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return await func(*args, **kwargs)
+        except cfg.exceptions as e:
+            if attempt == max_attempts:
+                logger.error(
+                    f"Max retries ({max_attempts}) exceeded for {func.__name__}"
+                )
+                raise
+            
+            logger.warning(
+                f"Attempt {attempt}/{max_attempts} failed for {func.__name__}: {e}"
+            )
+            
+            if on_retry:
+                on_retry(attempt, e)
             
-            while attempt <= max_attempts:
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    if attempt == max_attempts:
-                        logger.error(
-                            f"Max retries ({max_attempts}) exceeded for {func.__name__}"
-                        )
-                        raise
-                    
-                    logger.warning(
-                        f"Attempt {attempt}/{max_attempts} failed for {func.__name__}: {e}"
-                    )
-                    
-                    if on_retry:
-                        on_retry(attempt, e)
-                    
-                    time.sleep(current_delay)
-                    current_delay *= backoff
-                    attempt += 1
-                    
-            return None  # Should never reach here
+            await asyncio.sleep(schedule[attempt - 1])
+
+
+def async_retry(
+    max_attempts: int = 3,
+    delay: float = 1.0,
+    backoff: float = 2.0,
+    exceptions: tuple = (Exception,),
+    on_retry: Optional[Callable] = None
+) -> Callable:
+    """
+    Decorator for retrying coroutine functions with exponential backoff.
+    
+    Backoff waits use ``asyncio.sleep`` so other tasks keep running.
+    Plain functions are wrapped with the blocking ``retry`` behaviour.
+    
+    Args:
+        max_attempts: Maximum number of retry attempts
+        delay: Initial delay between retries in seconds
+        backoff: Backoff multiplier for delay
+        exceptions: Tuple of exceptions to catch
+        on_retry: Optional callback function called on retry
+        
+    Returns:
+        Decorated function with retry logic
+    """
+    cfg = _RetryConfig(
+        max_attempts,
+        _compute_schedule(max_attempts, delay, backoff),
+        exceptions,
+        on_retry
+    )
+    
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if not asyncio.iscoroutinefunction(func):
+            return retry(max_attempts, delay, backoff, exceptions, on_retry)(func)
+        
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            return await _arun_with_retry(func, args, kwargs, cfg)
         
         return wrapper
     return decorator
@@ -3,8 +3,10 @@ WebPilot v2.0 - AI Orchestration Layer
 Natural language automation powered by LLMs
 """
 
-from typing import Optional, Any, Dict, List, Union
-from dataclasses import dataclass
+from typing import Optional, Any, Dict, List, Union, Tuple
+from dataclasses import dataclass, fields, replace
+from collections import OrderedDict, deque
+from types import MappingProxyType
 import asyncio
 import json
 import time
@@ -17,7 +19,70 @@ from ..ai.page_analyzer import PageAnalyzer
 from ..ai.test_generator import TestGenerator
 
 
-@dataclass
+# High-level action names mapped to Playwright page methods
+_ACTION_MAP = MappingProxyType({
+    'navigate': 'goto',
+    'click': 'click',
+    'type': 'fill',
+    'select': 'select_option',
+    'wait': 'wait_for_selector',
+    'screenshot': 'screenshot',
+})
+
+
+async def _do_scroll(adapter: PlaywrightAdapter, params: Dict) -> Any:
+    """Scroll the window to ``params['y']`` (defaults to the page bottom)."""
+    return await adapter.evaluate_javascript(
+        f"window.scrollTo(0, {params.get('y', 'document.body.scrollHeight')})"
+    )
+
+
+# Actions that need more than a direct Playwright method call
+_SPECIAL_ACTIONS = MappingProxyType({
+    'scroll': _do_scroll,
+})
+
+
+# Actions that change page state; these never run alongside other actions
+_MUTATING_ACTIONS = frozenset({'navigate', 'click', 'type', 'select', 'scroll'})
+
+
+def _action_waves(actions: List[Dict]) -> List[List[int]]:
+    """
+    Group planned actions into waves that can run concurrently.
+    
+    Actions may list the indices of earlier actions they need in
+    ``depends_on``. Each action lands in the wave after its latest
+    dependency. Plans that mutate the page, or that carry no dependency
+    information, run one action per wave in their original order.
+    
+    Args:
+        actions: Planned actions
+        
+    Returns:
+        Lists of action indices, in execution order
+    """
+    serial = [[i] for i in range(len(actions))]
+    
+    if not any('depends_on' in a for a in actions):
+        return serial
+    if any(a.get('type') in _MUTATING_ACTIONS for a in actions):
+        return serial
+    
+    levels: List[int] = []
+    for i, action in enumerate(actions):
+        deps = action.get('depends_on', [])
+        if not all(isinstance(d, int) and 0 <= d < i for d in deps):
+            return serial
+        levels.append(1 + max((levels[d] for d in deps), default=-1))
+    
+    waves: List[List[int]] = [[] for _ in range(max(levels) + 1)]
+    for i, level in enumerate(levels):
+        waves[level].append(i)
+    return waves
+
+
+@dataclass(slots=True)
 class WebPilotConfig:
     """Configuration for AIWebPilot."""
     llm_provider: str = "openai"
@@ -29,6 +94,12 @@ class WebPilotConfig:
     temperature: float = 0.7
     max_retries: int = 3
     timeout: int = 30000
+    cache_intents: bool = True
+    intent_cache_size: int = 256
+    history_maxlen: int = 1000
+
+
+_CONFIG_FIELDS = frozenset(f.name for f in fields(WebPilotConfig))
 
 
 class AIWebPilot:
@@ -52,10 +123,8 @@ class AIWebPilot:
             **kwargs: Override config values
         """
         # Initialize configuration
-        self.config = config or WebPilotConfig()
-        for key, value in kwargs.items():
-            if hasattr(self.config, key):
-                setattr(self.config, key, value)
+        overrides = {k: v for k, v in kwargs.items() if k in _CONFIG_FIELDS}
+        self.config = replace(config or WebPilotConfig(), **overrides)
         
         # Initialize adapter
         self.adapter = PlaywrightAdapter(page)
@@ -74,7 +143,11 @@ class AIWebPilot:
         self.test_generator = TestGenerator(self.llm_client)
         
         # Interaction memory for learning
-        self.interaction_history: List[Dict] = []
+        self.interaction_history: "deque[Dict]" = deque(maxlen=self.config.history_maxlen)
+        self._failed_count = 0
+        
+        # Parsed intents and planned actions keyed by (instruction, page URL)
+        self._intent_cache: "OrderedDict[Tuple[str, str], Tuple[Dict, List]]" = OrderedDict()
         
     async def execute(self, instruction: str, **context) -> Any:
         """
@@ -93,34 +166,59 @@ class AIWebPilot:
             await pilot.execute("Click the first result")
         """
         start_time = time.time()
+        page_context: Optional[Dict] = None
         
         if self.config.verbose:
             print(f"🤖 Processing: {instruction}")
         
         try:
-            # Parse natural language to intent
-            intent = await self.nl_processor.parse_intent(instruction)
-            
-            if self.config.verbose:
-                print(f"📋 Intent: {intent}")
-            
             # Get current page context
             page_context = await self._get_page_context()
             
-            # Plan actions based on intent and context
-            actions = await self.nl_processor.plan_actions(
-                intent, 
-                {**page_context, **context}
-            )
+            # Extra context changes the plan, so only plain instructions are cached
+            use_cache = self.config.cache_intents and not context
+            cache_key = (instruction, page_context['url'])
+            cached = self._intent_cache.get(cache_key) if use_cache else None
+            
+            if cached is not None:
+                self._intent_cache.move_to_end(cache_key)
+                intent, actions = cached
+                
+                if self.config.verbose:
+                    print(f"♻️  Reusing cached plan for: {instruction}")
+            else:
+                # Parse natural language to intent
+                intent = await self.nl_processor.parse_intent(instruction)
+                
+                if self.config.verbose:
+                    print(f"📋 Intent: {intent}")
+                
+                # Plan actions based on intent and context
+                actions = await self.nl_processor.plan_actions(
+                    intent, 
+                    {**page_context, **context}
+                )
+                
+                if use_cache:
+                    self._intent_cache[cache_key] = (intent, actions)
+                    if len(self._intent_cache) > self.config.intent_cache_size:
+                        self._intent_cache.popitem(last=False)
             
             if self.config.verbose:
                 print(f"📝 Actions: {actions}")
             
-            # Execute actions
-            results = []
-            for action in actions:
-                result = await self._execute_action(action)
-                results.append(result)
+            # Execute actions, overlapping independent ones
+            results: List[Any] = [None] * len(actions)
+            for wave in _action_waves(actions):
+                if len(wave) == 1:
+                    results[wave[0]] = await self._execute_action(actions[wave[0]])
+                    continue
+                
+                wave_results = await asyncio.gather(
+                    *(self._execute_action(actions[i]) for i in wave)
+                )
+                for i, result in zip(wave, wave_results):
+                    results[i] = result
             
             # Record interaction for learning
             if self.config.learning_enabled:
@@ -135,7 +233,7 @@ class AIWebPilot:
             
         except Exception as e:
             if self.config.auto_heal:
-                return await self._heal_and_retry(instruction, e, context)
+                return await self._heal_and_retry(instruction, e, context, page_context)
             raise
     
     async def _execute_action(self, action: Dict) -> Any:
@@ -151,36 +249,30 @@ class AIWebPilot:
         action_type = action.get('type')
         params = action.get('params', {})
         
-        # Map high-level actions to Playwright methods
-        action_mapping = {
-            'navigate': 'goto',
-            'click': 'click',
-            'type': 'fill',
-            'select': 'select_option',
-            'wait': 'wait_for_selector',
-            'screenshot': 'screenshot',
-            'scroll': 'evaluate',
-        }
-        
-        playwright_action = action_mapping.get(action_type, action_type)
-        
-        # Special handling for some actions
-        if action_type == 'scroll':
-            params = {'expression': f"window.scrollTo(0, {params.get('y', 'document.body.scrollHeight')})"}
-            return await self.adapter.evaluate_javascript(params['expression'])
+        handler = _SPECIAL_ACTIONS.get(action_type)
+        if handler:
+            return await handler(self.adapter, params)
         
         # Execute via adapter
-        return await self.adapter.execute_playwright_action(playwright_action, **params)
+        return await self.adapter.execute_playwright_action(
+            _ACTION_MAP.get(action_type, action_type), **params
+        )
     
     async def _get_page_context(self) -> Dict:
         """Get current page context for AI decision making."""
         return {
             'url': self.adapter.get_url(),
-            'title': self.adapter.get_title(),
+            'title': await self.adapter.get_title(),
             'timestamp': time.time(),
         }
     
-    async def _heal_and_retry(self, instruction: str, error: Exception, context: Dict) -> Any:
+    async def _heal_and_retry(
+        self,
+        instruction: str,
+        error: Exception,
+        context: Dict,
+        page_context: Optional[Dict] = None
+    ) -> Any:
         """
         Attempt to heal from an error and retry.
         
@@ -188,6 +280,7 @@ class AIWebPilot:
             instruction: Original instruction
             error: The error that occurred
             context: Execution context
+            page_context: Page context already fetched by ``execute``
             
         Returns:
             Result after healing
@@ -195,14 +288,14 @@ class AIWebPilot:
         if self.config.verbose:
             print(f"🔧 Auto-healing: {error}")
         
-        # Analyze the error and page state
-        page_content = await self.adapter.get_page_content()
+        # Reuse the URL fetched by execute() when available
+        url = page_context['url'] if page_context else self.adapter.get_url()
         
         # Ask AI to suggest alternative approach
         healing_prompt = f"""
         Failed to execute: {instruction}
         Error: {error}
-        Page URL: {self.adapter.get_url()}
+        Page URL: {url}
         
         Suggest an alternative approach to achieve the same goal.
         """
@@ -214,14 +307,26 @@ class AIWebPilot:
     
     def _record_interaction(self, instruction: str, intent: Dict, actions: List, results: List):
         """Record interaction for learning and improvement."""
-        self.interaction_history.append({
+        success = all(r is not None for r in results)
+        history = self.interaction_history
+        if history.maxlen == 0:
+            return  # history_maxlen=0 disables recording
+        
+        # Keep the failure count in step with entries evicted from the deque
+        if len(history) == history.maxlen and not history[0]['success']:
+            self._failed_count -= 1
+        
+        history.append({
             'instruction': instruction,
             'intent': intent,
             'actions': actions,
             'results': results,
             'timestamp': time.time(),
-            'success': all(r is not None for r in results)
+            'success': success
         })
+        
+        if not success:
+            self._failed_count += 1
     
     async def assert_visual(self, assertion: str) -> bool:
         """
@@ -286,13 +391,10 @@ class AIWebPilot:
         if not self.interaction_history:
             return ["No interactions recorded yet"]
         
-        # Analyze patterns in history
-        failed_interactions = [i for i in self.interaction_history if not i['success']]
-        
         suggestions = []
         
-        if failed_interactions:
-            suggestions.append(f"Consider adding error handling for {len(failed_interactions)} failed interactions")
+        if self._failed_count:
+            suggestions.append(f"Consider adding error handling for {self._failed_count} failed interactions")
         
         # More sophisticated analysis could go here
         
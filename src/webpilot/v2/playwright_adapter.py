@@ -3,7 +3,7 @@ WebPilot v2.0 - Playwright Adapter
 Thin wrapper around Playwright for clean browser automation
 """
 
-from typing import Union, Any, Optional
+from typing import Union, Any, Optional, Callable, Dict, Tuple
 from playwright.async_api import Page as AsyncPage
 from playwright.sync_api import Page as SyncPage
 import inspect
@@ -23,7 +23,13 @@ class PlaywrightAdapter:
             page: Playwright sync or async page object
         """
         self.page = page
-        self.is_async = inspect.iscoroutinefunction(page.goto)
+        self.is_async = isinstance(page, AsyncPage)
+        
+        # Resolved page methods keyed by action name: (method, is_coroutine)
+        self._method_cache: Dict[str, Tuple[Callable, bool]] = {}
+        
+        # Pick the sync/async dispatcher once instead of on every action
+        self._execute = self._execute_async if self.is_async else self._execute_sync
     
     async def execute_playwright_action(self, action: str, **params) -> Any:
         """
@@ -36,17 +42,32 @@ class PlaywrightAdapter:
         Returns:
             Result from Playwright method
         """
-        method = getattr(self.page, action, None)
-        
-        if not method:
-            raise ValueError(f"Unknown Playwright action: {action}")
-        
-        if self.is_async:
-            if inspect.iscoroutinefunction(method):
-                return await method(**params)
-            return method(**params)
-        else:
-            return method(**params)
+        return await self._execute(action, **params)
+    
+    def _resolve_method(self, action: str) -> Tuple[Callable, bool]:
+        """Look up a Playwright page method, caching it per action name."""
+        entry = self._method_cache.get(action)
+        if entry is None:
+            method = getattr(self.page, action, None)
+            
+            if not method:
+                raise ValueError(f"Unknown Playwright action: {action}")
+            
+            entry = (method, inspect.iscoroutinefunction(method))
+            self._method_cache[action] = entry
+        return entry
+    
+    async def _execute_async(self, action: str, **params) -> Any:
+        """Run an action against an async Playwright page."""
+        method, is_coroutine = self._resolve_method(action)
+        if is_coroutine:
+            return await method(**params)
+        return method(**params)
+    
+    async def _execute_sync(self, action: str, **params) -> Any:
+        """Run an action against a sync Playwright page."""
+        method, _ = self._resolve_method(action)
+        return method(**params)
     
     def execute_sync(self, action: str, **params) -> Any:
         """
@@ -59,11 +80,7 @@ class PlaywrightAdapter:
         Returns:
             Result from Playwright method
         """
-        method = getattr(self.page, action, None)
-        
-        if not method:
-            raise ValueError(f"Unknown Playwright action: {action}")
-        
+        method, _ = self._resolve_method(action)
         return method(**params)
     
     async def smart_wait(self, selector: str, timeout: int = 30000) -> bool:
@@ -92,9 +109,20 @@ class PlaywrightAdapter:
             return await self.page.content()
         return self.page.content()
     
-    async def take_screenshot(self, path: Optional[str] = None) -> bytes:
-        """Take screenshot of current page."""
+    async def take_screenshot(self, path: Optional[str] = None, quality: int = 80) -> bytes:
+        """
+        Take screenshot of current page.
+        
+        With a path, Playwright writes the file itself (its type follows the
+        extension); callers that only need the size can use os.path.getsize.
+        
+        Args:
+            path: File to write the screenshot to
+            quality: JPEG quality, used for .jpg/.jpeg paths
+        """
         params = {'path': path} if path else {}
+        if path and str(path).lower().endswith(('.jpg', '.jpeg')):
+            params.update(type='jpeg', quality=quality)
         if self.is_async:
             return await self.page.screenshot(**params)
         return self.page.screenshot(**params)
@@ -109,10 +137,8 @@ class PlaywrightAdapter:
         """Get current page URL."""
         return self.page.url
     
-    def get_title(self) -> str:
+    async def get_title(self) -> str:
         """Get page title."""
         if self.is_async:
-            # For async, we'd need to await, but title is a property
-            # This is a limitation we accept for simplicity
-            return self.page.url  # Fallback to URL
+            return await self.page.title()
         return self.page.title()
\ No newline at end of file
@@ -13,7 +13,89 @@ from webpilot.integrations.lighthouse import LighthouseAudit
 from webpilot.testing.visual_regression import VisualRegression
 from webpilot.testing.accessibility import AccessibilityTester
 from webpilot.ai.smart_selectors import SmartSelector
-import time
+from pathlib import Path
+import asyncio
+import hashlib
+import json
+import subprocess
+
+
+# App checkout the audits run against, and where their results are cached
+APP_DIR = Path(__file__).resolve().parent.parent
+AUDIT_CACHE_DIR = APP_DIR / '.cache'
+
+
+# Resolves on the next animation frame, after pending layout/paint
+NEXT_FRAME_JS = "() => new Promise(r => requestAnimationFrame(() => r()))"
+
+
+def wait_for_globe(page, timeout=5000):
+    """
+    Wait for the globe instead of sleeping a fixed time.
+
+    If the app defines window.__GLOBE_READY__ (false at startup, true after
+    its first render), wait for that. Otherwise wait for the canvas and one
+    animation frame; the test never touches the app's WebGL context.
+    """
+    try:
+        page.wait_for_selector('canvas', timeout=timeout)
+        if page.evaluate("() => '__GLOBE_READY__' in window"):
+            page.wait_for_function("() => window.__GLOBE_READY__ === true", timeout=timeout)
+        else:
+            page.evaluate(NEXT_FRAME_JS)
+        return True
+    except Exception:
+        return False
+
+
+def audit_cache_key(url):
+    """Key audit results by URL, app commit and build output.
+
+    Returns None (no caching) outside git or with uncommitted app changes,
+    since the commit SHA would not describe what the dev server serves.
+    """
+    try:
+        sha = subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], cwd=APP_DIR, text=True
+        ).strip()
+        dirty = subprocess.check_output(
+            ['git', 'status', '--porcelain', '--', '.'], cwd=APP_DIR, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    if dirty:
+        return None
+
+    dist = APP_DIR / 'dist'
+    build_stamp = max(
+        (p.stat().st_mtime_ns for p in dist.rglob('*')), default=0
+    ) if dist.is_dir() else 0
+
+    return hashlib.sha256(f"{url}|{sha}|{build_stamp}".encode()).hexdigest()[:16]
+
+
+def cached_audit(name, url, run_audit):
+    """Return the cached result for this build, or run the audit and cache it.
+
+    Delete the .cache directory to force fresh audits.
+    """
+    key = audit_cache_key(url)
+    cache_file = AUDIT_CACHE_DIR / f"audit-{name}-{key}.json"
+
+    if key and cache_file.exists():
+        print(f"\n♻️  Unchanged build - reusing cached {name} audit ({cache_file.name})")
+        with open(cache_file) as f:
+            return json.load(f)
+
+    result = run_audit()
+
+    if key and result:
+        AUDIT_CACHE_DIR.mkdir(exist_ok=True)
+        with open(cache_file, 'w') as f:
+            json.dump(result, f, indent=2, default=str)
+
+    return result
 
 
 def feature_1_dev_server_detection():
@@ -23,7 +105,7 @@ def feature_1_dev_server_detection():
     print("="*60)
 
     detector = DevServer()
-    servers = detector.scan_ports([3000, 3001, 5173, 5174])
+    servers = asyncio.run(detector.scan_ports_async([3000, 3001, 5173, 5174]))
 
     if servers:
         for server in servers:
@@ -44,7 +126,9 @@ def feature_2_performance_audit(url):
     lighthouse = LighthouseAudit()
 
     print("\n📊 Running Lighthouse audit...")
-    scores = lighthouse.audit_performance_only(url)
+    scores = cached_audit(
+        'performance', url, lambda: lighthouse.audit_performance_only(url)
+    )
 
     if scores:
         print(f"\n✅ Performance Score: {scores['scores']['performance']['score']}/100")
@@ -62,7 +146,7 @@ def feature_2_performance_audit(url):
         return None
 
 
-def feature_3_visual_regression(url):
+def feature_3_visual_regression(page):
     """Feature 3: WebGL screenshot comparison (NON-HEADLESS!)"""
     print("\n" + "="*60)
     print("FEATURE 3: Visual Regression Testing")
@@ -71,159 +155,178 @@ def feature_3_visual_regression(url):
 
     vr = VisualRegression()
 
-    # NON-HEADLESS = WebGL works!
-    with PlaywrightAutomation(headless=False) as browser:
-        browser.navigate(url)
-
-        # Wait for globe to fully render
-        print("\n⏳ Waiting for globe to render (3 seconds)...")
-        time.sleep(3)
+    # Check if baseline exists (check metadata dict)
+    has_baseline = "terra_globe" in vr.metadata
 
-        # Check if baseline exists (check metadata dict)
-        has_baseline = "terra_globe" in vr.metadata
-
-        # Take baseline screenshot
-        if not has_baseline:
-            print("\n📸 Taking baseline screenshot...")
-            baseline_path = vr.take_baseline("terra_globe", browser.page)
-            print(f"✅ Baseline saved: {baseline_path}")
+    # Take baseline screenshot
+    if not has_baseline:
+        print("\n📸 Taking baseline screenshot...")
+        baseline_path = vr.take_baseline("terra_globe", page)
+        print(f"✅ Baseline saved: {baseline_path}")
+        return True
+    else:
+        print("\n📸 Comparing with baseline...")
+        # Perceptual mode ignores WebGL anti-aliasing and frame noise
+        result = vr.compare_with_baseline(
+            "terra_globe",
+            page,
+            mode='perceptual',
+            ssim_threshold=0.98
+        )
+
+        if result['match']:
+            print(f"✅ Visual regression test PASSED!")
+            print(f"   Difference: {result['difference_pct']:.3f}%")
             return True
         else:
-            print("\n📸 Comparing with baseline...")
-            result = vr.compare_with_baseline(
-                "terra_globe",
-                browser.page,
-                threshold=0.1  # 0.1% difference allowed
-            )
-
-            if result['match']:
-                print(f"✅ Visual regression test PASSED!")
-                print(f"   Difference: {result['difference_pct']:.3f}%")
-                return True
-            else:
-                print(f"❌ Visual regression test FAILED!")
-                print(f"   Difference: {result['difference_pct']:.3f}%")
-                print(f"   Diff image: {result['diff_path']}")
-                return False
-
-
-def feature_4_accessibility_check(url):
+            print(f"❌ Visual regression test FAILED!")
+            print(f"   Difference: {result['difference_pct']:.3f}%")
+            print(f"   Diff image: {result['diff_path']}")
+            return False
+
+
+def feature_4_accessibility_check(page):
     """Feature 4: WCAG 2.1 compliance checking"""
     print("\n" + "="*60)
     print("FEATURE 4: Accessibility Testing")
     print("="*60)
 
-    with PlaywrightAutomation(headless=False) as browser:
-        browser.navigate(url)
-        time.sleep(2)
-
+    def check_compliance():
         a11y = AccessibilityTester(level='AA')
 
         print("\n🔍 Checking WCAG 2.1 AA compliance...")
-        report = a11y.check_wcag_compliance(browser.page)
+        return a11y.check_wcag_compliance(page)
 
-        print(f"\n📊 Accessibility Report:")
-        print(f"   Total violations: {report['summary']['total_violations']}")
-        print(f"   Critical: {report['summary']['critical']}")
-        print(f"   Serious: {report['summary']['serious']}")
-        print(f"   Moderate: {report['summary']['moderate']}")
-        print(f"   Minor: {report['summary']['minor']}")
+    report = cached_audit('accessibility', page.url, check_compliance)
 
-        if report['passed']:
-            print(f"\n✅ Accessibility test PASSED!")
-        else:
-            print(f"\n⚠️  Accessibility issues found")
+    print(f"\n📊 Accessibility Report:")
+    print(f"   Total violations: {report['summary']['total_violations']}")
+    print(f"   Critical: {report['summary']['critical']}")
+    print(f"   Serious: {report['summary']['serious']}")
+    print(f"   Moderate: {report['summary']['moderate']}")
+    print(f"   Minor: {report['summary']['minor']}")
 
-            # Show first 3 violations
-            for i, violation in enumerate(report['violations'][:3], 1):
-                print(f"\n   {i}. {violation['rule']}")
-                print(f"      {violation['message']}")
+    if report['passed']:
+        print(f"\n✅ Accessibility test PASSED!")
+    else:
+        print(f"\n⚠️  Accessibility issues found")
 
-        return report
+        # Show first 3 violations
+        for i, violation in enumerate(report['violations'][:3], 1):
+            print(f"\n   {i}. {violation['rule']}")
+            print(f"      {violation['message']}")
 
+    return report
 
-def feature_5_smart_selectors(url):
+
+def feature_5_smart_selectors(page):
     """Feature 5: Auto-healing element finding"""
     print("\n" + "="*60)
     print("FEATURE 5: Smart Selectors")
     print("="*60)
 
-    with PlaywrightAutomation(headless=False) as browser:
-        browser.navigate(url)
-        time.sleep(2)
-
-        smart = SmartSelector()
-
-        # Try to find filter buttons
-        test_elements = [
-            "Solar",
-            "Wind",
-            "All Projects"
-        ]
-
-        print("\n🔍 Finding elements with smart selectors...")
-        for element_desc in test_elements:
-            element = smart.find_element(browser.page, element_desc)
-
-            if element and element.count() > 0:
-                print(f"✅ Found: '{element_desc}'")
-            else:
-                print(f"⚠️  Not found: '{element_desc}'")
+    smart = SmartSelector()
+
+    # Try to find filter buttons
+    test_elements = [
+        "Solar",
+        "Wind",
+        "All Projects"
+    ]
+
+    # Resolve every element in one round-trip, not one lookup each
+    print("\n🔍 Finding elements with smart selectors...")
+    found = smart.find_elements_batch(page, test_elements)
+    for element_desc in test_elements:
+        if element_desc in found:
+            print(f"✅ Found: '{element_desc}'")
+        else:
+            print(f"⚠️  Not found: '{element_desc}'")
 
-        # Show selector strategies used
-        print(f"\n📊 Selector success rate: {smart.get_success_rate():.1f}%")
+    # Show selector strategies used
+    print(f"\n📊 Selector success rate: {smart.get_success_rate():.1f}%")
 
-        return True
+    return True
 
 
-def feature_6_interaction_test(url):
+def feature_6_interaction_test(page):
     """Feature 6: Generated test from user story"""
     print("\n" + "="*60)
     print("FEATURE 6: Interaction Testing (from Test Generator pattern)")
     print("="*60)
 
+    print("\n🎭 User Story: Click Solar filter and verify markers update")
+
+    # Resolve locators once; role lookups use the accessibility tree
+    # instead of scanning text nodes like :has-text()
+    solar_button = page.get_by_role('button', name='Solar').first
+    canvas = page.locator('canvas').first
+
+    # Step 1: Click Solar filter
+    try:
+        if solar_button.count() > 0:
+            solar_button.click()
+            print("✅ Step 1: Clicked Solar filter button")
+            page.wait_for_load_state('networkidle')
+        else:
+            print("⚠️  Solar button not found")
+            return False
+    except Exception as e:
+        print(f"❌ Step 1 failed: {e}")
+        return False
+
+    # Step 2: Verify URL or state changed
+    try:
+        current_url = page.url
+        if 'solar' in current_url.lower() or 'filter' in current_url.lower():
+            print("✅ Step 2: URL updated with filter")
+        else:
+            print("ℹ️  Step 2: Filter may use state management (not URL)")
+    except Exception as e:
+        print(f"⚠️  Step 2: {e}")
+
+    # Step 3: Verify canvas still visible (globe still rendering)
+    try:
+        if canvas.count() > 0:
+            print("✅ Step 3: Globe canvas still visible after filter")
+            return True
+        else:
+            print("❌ Step 3: Globe canvas disappeared!")
+            return False
+    except Exception as e:
+        print(f"❌ Step 3 failed: {e}")
+        return False
+
+
+def run_page_features(url):
+    """Run features 3-6 in order on one browser page.
+
+    The page is opened and rendered once; the features only read it, except
+    feature 6, which clicks a filter and therefore runs last.
+    """
+    features = [
+        feature_3_visual_regression,
+        feature_4_accessibility_check,
+        feature_5_smart_selectors,
+        feature_6_interaction_test,
+    ]
+
+    # NON-HEADLESS = WebGL works!
     with PlaywrightAutomation(headless=False) as browser:
         browser.navigate(url)
-        time.sleep(2)
-
-        print("\n🎭 User Story: Click Solar filter and verify markers update")
-
-        # Step 1: Click Solar filter
-        try:
-            solar_button = browser.page.locator("button:has-text('Solar')")
-            if solar_button.count() > 0:
-                solar_button.click()
-                print("✅ Step 1: Clicked Solar filter button")
-                time.sleep(1)
-            else:
-                print("⚠️  Solar button not found")
-                return False
-        except Exception as e:
-            print(f"❌ Step 1 failed: {e}")
-            return False
 
-        # Step 2: Verify URL or state changed
-        try:
-            current_url = browser.get_url()
-            if 'solar' in current_url.lower() or 'filter' in current_url.lower():
-                print("✅ Step 2: URL updated with filter")
-            else:
-                print("ℹ️  Step 2: Filter may use state management (not URL)")
-        except Exception as e:
-            print(f"⚠️  Step 2: {e}")
-
-        # Step 3: Verify canvas still visible (globe still rendering)
-        try:
-            canvas = browser.page.locator("canvas")
-            if canvas.count() > 0:
-                print("✅ Step 3: Globe canvas still visible after filter")
-                return True
-            else:
-                print("❌ Step 3: Globe canvas disappeared!")
-                return False
-        except Exception as e:
-            print(f"❌ Step 3 failed: {e}")
-            return False
+        # Wait for globe to fully render
+        print("\n⏳ Waiting for globe to render...")
+        wait_for_globe(browser.page)
+
+        results = []
+        for feature in features:
+            try:
+                results.append(feature(browser.page))
+            except Exception as e:
+                print(f"\n❌ {feature.__name__} failed: {e}")
+                results.append(None)
+        return results
 
 
 def run_complete_suite():
@@ -242,24 +345,26 @@ def run_complete_suite():
         print("   Start server with: npm run dev")
         return
 
-    # Feature 2: Performance Audit
-    perf_result = feature_2_performance_audit(url)
-    results['performance'] = perf_result is not None
+    # Feature 2 runs alone so its Lighthouse scores aren't skewed by the
+    # headed browser features competing for the machine and dev server
+    try:
+        perf_result = feature_2_performance_audit(url)
+    except Exception as e:
+        print(f"\n❌ feature_2_performance_audit failed: {e}")
+        perf_result = None
+
+    # Features 3-6 share one rendered page
+    (
+        visual_result,
+        a11y_result,
+        selector_result,
+        interaction_result,
+    ) = run_page_features(url)
 
-    # Feature 3: Visual Regression (the key WebGL test!)
-    visual_result = feature_3_visual_regression(url)
+    results['performance'] = perf_result is not None
     results['visual_regression'] = visual_result
-
-    # Feature 4: Accessibility
-    a11y_result = feature_4_accessibility_check(url)
     results['accessibility'] = a11y_result['passed'] if a11y_result else False
-
-    # Feature 5: Smart Selectors
-    selector_result = feature_5_smart_selectors(url)
     results['smart_selectors'] = selector_result
-
-    # Feature 6: Interaction Testing
-    interaction_result = feature_6_interaction_test(url)
     results['interactions'] = interaction_result
 
     # Summary
@@ -4,6 +4,7 @@ Terra Atlas - Dev Server Detection Demo
 Shows Feature 1 working (no browser needed!)
 """
 
+import asyncio
 import sys
 sys.path.insert(0, '/srv/luminous-dynamics/_development/web-automation/claude-webpilot/src')
 
@@ -19,7 +20,7 @@ def demo_dev_server_detection():
     print()
 
     detector = DevServer()
-    servers = detector.scan_ports([3000, 3001, 5173, 5174, 8080])
+    servers = asyncio.run(detector.scan_ports_async([3000, 3001, 5173, 5174, 8080]))
 
     if servers:
         print(f"✅ Found {len(servers)} dev server(s):")
@@ -13,41 +13,108 @@ Run: python tests/webpilot-globe-test.py
 import sys
 sys.path.insert(0, '/srv/luminous-dynamics/_development/web-automation/claude-webpilot/src')
 
-from webpilot.core import PlaywrightAutomation
 from webpilot.integrations.dev_server import DevServer
+from playwright.sync_api import sync_playwright
+from contextlib import contextmanager
 import time
 
 
-def test_globe_component():
+# Resolves on the next animation frame, after pending layout/paint
+NEXT_FRAME_JS = "() => new Promise(r => requestAnimationFrame(() => r()))"
+
+
+def wait_for_globe(page, timeout=5000):
+    """
+    Wait for the globe instead of sleeping a fixed time.
+
+    If the app defines window.__GLOBE_READY__ (false at startup, true after
+    its first render), wait for that. Otherwise wait for the canvas and one
+    animation frame; the test never touches the app's WebGL context.
+    """
+    try:
+        page.wait_for_selector('canvas', timeout=timeout)
+        if page.evaluate("() => '__GLOBE_READY__' in window"):
+            page.wait_for_function("() => window.__GLOBE_READY__ === true", timeout=timeout)
+        else:
+            page.evaluate(NEXT_FRAME_JS)
+        return True
+    except Exception:
+        return False
+
+
+# Lighthouse's "Slow 4G" profile with 4x CPU slowdown, so localhost load
+# times are comparable with Lighthouse rather than unrealistically fast
+THROTTLE_NETWORK = {
+    'offline': False,
+    'latency': 150,                                # ms RTT
+    'downloadThroughput': 1.6 * 1024 * 1024 / 8,   # 1.6 Mbps in bytes/s
+    'uploadThroughput': 750 * 1024 / 8,            # 750 Kbps in bytes/s
+}
+THROTTLE_CPU_RATE = 4
+
+# Seconds until the globe canvas appears under the throttled profile above.
+# Slow 4G plus 4x CPU stretches an unthrottled ~2s load to well past 5s, so
+# the budget is set for that profile rather than for a fast local run.
+LOAD_BUDGET_S = 10
+
+
+# Cookies/localStorage saved by the first test and loaded by the rest. Kept
+# in memory so every run starts clean, never with state from an older build.
+_storage_state = None
+
+
+@contextmanager
+def new_page(browser, viewport=None):
+    """Open a fresh context on the shared browser (far cheaper than a launch)"""
+    global _storage_state
+    options = {'viewport': viewport or {'width': 1366, 'height': 768}}
+    if _storage_state is not None:
+        options['storage_state'] = _storage_state
+
+    context = browser.new_context(**options)
+    try:
+        yield context.new_page()
+        if _storage_state is None:
+            _storage_state = context.storage_state()
+    finally:
+        context.close()
+
+
+def test_globe_component(browser):
     """Test that globe component loads and basic structure exists"""
     print("\n🧪 Test 1: Globe Component Loading")
     print("=" * 60)
 
-    with PlaywrightAutomation(headless=False) as browser:
-        browser.navigate("http://localhost:3000")
+    with new_page(browser) as page:
+        page.goto("http://localhost:3000", wait_until='domcontentloaded')
 
         # Wait for page to load
-        time.sleep(2)
+        wait_for_globe(page)
+
+        # Gather all checks in one round-trip to the browser
+        state = page.evaluate("""
+            () => ({
+                hasCanvas: !!document.querySelector('canvas'),
+                hasContainer: !!document.querySelector('.relative.w-full'),
+                errors: window.__CONSOLE_ERRORS__ || []
+            })
+        """)
 
         # Test 1: Canvas element exists (WebGL renders to canvas)
-        canvas = browser.page.query_selector("canvas")
-        if canvas:
+        if state['hasCanvas']:
             print("  ✅ Canvas element found (WebGL ready)")
         else:
             print("  ❌ Canvas element not found")
             return False
 
         # Test 2: Globe container has correct classes
-        globe_container = browser.page.query_selector(".relative.w-full")
-        if globe_container:
+        if state['hasContainer']:
             print("  ✅ Globe container found")
         else:
             print("  ❌ Globe container not found")
 
         # Test 3: No console errors
-        errors = browser.page.evaluate("""
-            () => window.__CONSOLE_ERRORS__ || []
-        """)
+        errors = state['errors']
         if len(errors) == 0:
             print("  ✅ No console errors")
         else:
@@ -57,53 +124,64 @@ def test_globe_component():
         return True
 
 
-def test_project_data_loading():
+def test_project_data_loading(browser):
     """Test that project data loads correctly"""
     print("\n🧪 Test 2: Project Data Loading")
     print("=" * 60)
 
-    with PlaywrightAutomation(headless=False) as browser:
-        browser.navigate("http://localhost:3000")
-        time.sleep(3)  # Wait for data fetch
+    with new_page(browser) as page:
+        page.goto("http://localhost:3000", wait_until='domcontentloaded')
+        page.wait_for_load_state('networkidle')  # Wait for data fetch
+
+        # Gather all checks in one round-trip to the browser
+        state = page.evaluate("""
+            () => ({
+                hasProjectInfo: /projects?/i.test(document.body.innerText),
+                // Placeholder - actual check would inspect the Three.js
+                // scene, where markers are typically Scene children
+                markersCount: document.querySelector('canvas') ? 1 : 0
+            })
+        """)
 
         # Test 1: Project count is displayed
-        project_info = browser.page.query_selector("text=/projects?/i")
-        if project_info:
+        if state['hasProjectInfo']:
             print("  ✅ Project count displayed")
         else:
             print("  ⚠️  Project count not visible")
 
         # Test 2: Check if markers data exists in state
-        markers_count = browser.page.evaluate("""
-            () => {
-                // Try to access React component state
-                const canvas = document.querySelector('canvas');
-                if (!canvas) return 0;
-
-                // In Three.js, markers are typically Scene children
-                // This is a simplified check
-                return 1; // Placeholder - actual check would inspect Three.js scene
-            }
-        """)
+        markers_count = state['markersCount']
         print(f"  ✅ Data loading check complete")
 
         return True
 
 
-def test_filter_interactions():
+def test_filter_interactions(browser):
     """Test project type filter interactions"""
     print("\n🧪 Test 3: Filter Interactions")
     print("=" * 60)
 
-    with PlaywrightAutomation(headless=False) as browser:
-        browser.navigate("http://localhost:3000")
-        time.sleep(2)
+    with new_page(browser) as page:
+        page.goto("http://localhost:3000", wait_until='domcontentloaded')
+        # Headless has no WebGL frame to wait for; the canvas is enough
+        page.wait_for_selector("canvas", timeout=5000)
 
-        # Test 1: Filter buttons exist
-        all_button = browser.page.query_selector("button:has-text('All Projects')")
-        solar_button = browser.page.query_selector("button:has-text('Solar')")
+        # Test 1: Filter buttons exist (both looked up in one round-trip)
+        buttons = page.evaluate("""
+            () => {
+                const labels = Array.from(
+                    document.querySelectorAll('button'), b => b.innerText
+                );
+                return {
+                    all: labels.some(t => t.includes('All Projects')),
+                    solar: labels.some(t => t.includes('Solar'))
+                };
+            }
+        """)
+        all_button = page.locator("button:has-text('All Projects')").first
+        solar_button = page.locator("button:has-text('Solar')").first
 
-        if all_button and solar_button:
+        if buttons['all'] and buttons['solar']:
             print("  ✅ Filter buttons found")
         else:
             print("  ❌ Filter buttons not found")
@@ -112,35 +190,35 @@ def test_filter_interactions():
         # Test 2: Click solar filter
         print("  🖱️  Clicking 'Solar' filter...")
         solar_button.click()
-        time.sleep(1)
+        page.wait_for_load_state('networkidle')
 
         # Test 3: Verify URL or state changed
-        url = browser.page.url
+        url = page.url
         print(f"  ✅ Filter interaction successful")
 
         # Test 4: Click back to All
         print("  🖱️  Clicking 'All Projects' filter...")
         all_button.click()
-        time.sleep(1)
+        page.wait_for_load_state('networkidle')
 
         print("  ✅ Filter interaction test PASSED")
         return True
 
 
-def test_project_details_interaction():
+def test_project_details_interaction(browser):
     """Test clicking on project to open details"""
     print("\n🧪 Test 4: Project Details Interaction")
     print("=" * 60)
 
-    with PlaywrightAutomation(headless=False) as browser:
-        browser.navigate("http://localhost:3000")
-        time.sleep(3)
+    with new_page(browser) as page:
+        page.goto("http://localhost:3000", wait_until='domcontentloaded')
+        page.wait_for_load_state('networkidle')
 
         # Note: Since we can't actually see the 3D markers to click them,
         # we'll test the details panel can be opened programmatically
 
         # Check if details panel exists in DOM
-        details_panel = browser.page.query_selector(".project-details")
+        details_panel = page.query_selector(".project-details")
 
         print("  ✅ Project details component exists")
 
@@ -154,50 +232,61 @@ def test_project_details_interaction():
         return True
 
 
-def test_responsive_layout():
+def test_responsive_layout(browser):
     """Test responsive behavior at different screen sizes"""
     print("\n🧪 Test 5: Responsive Layout")
     print("=" * 60)
 
-    with PlaywrightAutomation(headless=False) as browser:
-        # Test desktop size
-        browser.page.set_viewport_size({"width": 1920, "height": 1080})
-        browser.navigate("http://localhost:3000")
-        time.sleep(2)
+    # Test desktop size: open at that size rather than resizing before load
+    with new_page(browser, viewport={"width": 1920, "height": 1080}) as page:
+        page.goto("http://localhost:3000", wait_until='domcontentloaded')
+        # Headless has no WebGL frame to wait for; the canvas is enough
+        page.wait_for_selector("canvas", timeout=5000)
 
-        desktop_layout = browser.page.query_selector(".container")
+        desktop_layout = page.query_selector(".container")
         print("  ✅ Desktop layout renders")
 
-        # Test mobile size
-        browser.page.set_viewport_size({"width": 375, "height": 667})
-        time.sleep(1)
+        # Test mobile size on the already-loaded page, no second navigation
+        page.set_viewport_size({"width": 375, "height": 667})
+        # Let the layout reflow for one frame
+        page.evaluate(NEXT_FRAME_JS)
 
-        mobile_layout = browser.page.query_selector(".container")
+        mobile_layout = page.query_selector(".container")
         print("  ✅ Mobile layout renders")
 
         print("  ✅ Responsive layout test PASSED")
         return True
 
 
-def test_performance_metrics():
+def test_performance_metrics(browser):
     """Test page load performance"""
     print("\n🧪 Test 6: Performance Metrics")
     print("=" * 60)
 
-    with PlaywrightAutomation(headless=False) as browser:
+    with new_page(browser) as page:
+        cdp = page.context.new_cdp_session(page)
+
+        # Throttle like Lighthouse so the numbers mean something on localhost
+        cdp.send('Network.enable')
+        cdp.send('Network.emulateNetworkConditions', THROTTLE_NETWORK)
+        cdp.send('Emulation.setCPUThrottlingRate', {'rate': THROTTLE_CPU_RATE})
+
         start_time = time.time()
-        browser.navigate("http://localhost:3000")
+        page.goto("http://localhost:3000", wait_until='domcontentloaded')
 
-        # Wait for canvas to appear
-        browser.page.wait_for_selector("canvas", timeout=5000)
+        # Wait for canvas to appear (allow for the throttled connection)
+        page.wait_for_selector("canvas", timeout=30000)
         load_time = time.time() - start_time
 
-        print(f"  ⏱️  Page load time: {load_time:.2f}s")
+        cdp.detach()
 
-        if load_time < 5:
-            print("  ✅ Load time acceptable (<5s)")
+        print(f"  ⏱️  Page load time (Slow 4G, {THROTTLE_CPU_RATE}x CPU): {load_time:.2f}s")
+
+        if load_time < LOAD_BUDGET_S:
+            print(f"  ✅ Load time acceptable (<{LOAD_BUDGET_S}s)")
         else:
-            print("  ⚠️  Load time slow (>5s)")
+            print(f"  ❌ Load time over budget (>{LOAD_BUDGET_S}s)")
+            return False
 
         # Check for memory leaks (simplified)
         print("  ℹ️  Memory leak testing requires extended session")
@@ -227,24 +316,36 @@ def main():
     print(f"✅ Found dev server: {servers[0]['framework']} at {servers[0]['url']}")
     print()
 
-    # Run all tests
+    # Run all tests: (test, needs WebGL). WebGL only renders headed.
     tests = [
-        test_globe_component,
-        test_project_data_loading,
-        test_filter_interactions,
-        test_project_details_interaction,
-        test_responsive_layout,
-        test_performance_metrics
+        (test_globe_component, True),
+        (test_project_data_loading, True),
+        (test_filter_interactions, False),
+        (test_project_details_interaction, False),
+        (test_responsive_layout, False),
+        (test_performance_metrics, True)
     ]
 
+    # Launch each browser once for the whole suite; each test gets its own context
+    playwright = sync_playwright().start()
+    browsers = {}
+
     results = []
-    for test in tests:
-        try:
-            result = test()
-            results.append(result)
-        except Exception as e:
-            print(f"  ❌ Test failed with error: {e}")
-            results.append(False)
+    try:
+        browsers[True] = playwright.chromium.launch(headless=False)
+        browsers[False] = playwright.chromium.launch(headless=True)
+
+        for test, needs_webgl in tests:
+            try:
+                result = test(browsers[needs_webgl])
+                results.append(result)
+            except Exception as e:
+                print(f"  ❌ Test failed with error: {e}")
+                results.append(False)
+    finally:
+        for browser in browsers.values():
+            browser.close()
+        playwright.stop()
 
     # Summary
     print("\n" + "=" * 60)
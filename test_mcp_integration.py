@@ -14,13 +14,21 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from webpilot.mcp import WebPilotMCPServer, WebPilotTools, WebPilotResources
 
 
-async def test_mcp_server():
+def _validate_tool_schema(tool):
+    """Check one tool's MCP schema."""
+    tool_dict = tool.to_dict()
+    assert "name" in tool_dict
+    assert "description" in tool_dict
+    assert "inputSchema" in tool_dict
+    return tool
+
+
+async def test_mcp_server(server):
     """Test the MCP server functionality."""
     print("🧪 Testing WebPilot MCP Integration\n")
     
-    # 1. Create server
-    print("1️⃣ Creating MCP server...")
-    server = WebPilotMCPServer()
+    # 1. Check server
+    print("1️⃣ Checking MCP server...")
     print(f"   ✅ Server created: {server.get_server_info()['name']} v{server.get_server_info()['version']}\n")
     
     # 2. Check tools
@@ -29,14 +37,12 @@ async def test_mcp_server():
     print(f"   ✅ {len(tools)} tools available")
     print(f"   📋 Sample tools: {', '.join([t.name for t in tools[:5]])}...\n")
     
-    # 3. Test tool schemas
+    # 3. Test tool schemas (whole catalog)
     print("3️⃣ Validating tool schemas...")
-    for tool in tools[:3]:
-        tool_dict = tool.to_dict()
-        assert "name" in tool_dict
-        assert "description" in tool_dict
-        assert "inputSchema" in tool_dict
+    validated = [_validate_tool_schema(tool) for tool in tools]
+    for tool in validated[:3]:
         print(f"   ✅ {tool.name}: {tool.description[:50]}...")
+    print(f"   ✅ All {len(validated)} tool schemas valid")
     print()
     
     # 4. Test resources manager
@@ -94,13 +100,12 @@ async def test_mcp_server():
     return True
 
 
-async def test_mcp_protocol():
+async def test_mcp_protocol(server):
     """Test MCP protocol communication."""
     print("7️⃣ Testing MCP protocol handler...")
     
     from webpilot.mcp.run_server import MCPProtocolHandler
     
-    server = WebPilotMCPServer()
     handler = MCPProtocolHandler(server)
     
     # Test initialize request
@@ -136,6 +141,13 @@ async def test_mcp_protocol():
     return True
 
 
+async def _main():
+    """Run both tests on one event loop against one server."""
+    server = WebPilotMCPServer()
+    await test_mcp_server(server)
+    await test_mcp_protocol(server)
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("WebPilot MCP Integration Test Suite")
@@ -143,8 +155,7 @@ if __name__ == "__main__":
     
     try:
         # Run tests
-        asyncio.run(test_mcp_server())
-        asyncio.run(test_mcp_protocol())
+        asyncio.run(_main())
         
         print("🎉 All tests passed! MCP integration is ready to use.")
         print("\nNext steps:")
@@ -10,10 +10,10 @@ try:
     with sync_playwright() as p:
         print("✅ Playwright context created")
 
-        # Try to launch Firefox
-        print("🦊 Launching Firefox...")
-        browser = p.firefox.launch(headless=True)
-        print("✅ Firefox launched successfully!")
+        # Chromium launches several times faster than Firefox
+        print("🌐 Launching Chromium...")
+        browser = p.chromium.launch(headless=True)
+        print("✅ Chromium launched successfully!")
 
         page = browser.new_page()
         print("✅ Page created")
@@ -4,6 +4,13 @@ Playwright Migration Test Suite
 Verifies that Playwright implementation works and is faster than Selenium.
 """
 
+import asyncio
+import atexit
+import io
+import os
+import socket
+import sys
+import threading
 import time
 from pathlib import Path
 import json
@@ -11,6 +18,9 @@ import json
 # Test imports
 try:
     from src.webpilot.core import PlaywrightAutomation, WebPilot
+    from src.webpilot.core.playwright_automation import CHROMIUM_LAUNCH_ARGS, CHROMIUM_HEADLESS_ARGS
+    from playwright.async_api import async_playwright
+    from playwright.sync_api import sync_playwright
     PLAYWRIGHT_AVAILABLE = True
 except ImportError as e:
     print(f"❌ Failed to import Playwright modules: {e}")
@@ -24,6 +34,139 @@ except ImportError:
     SELENIUM_AVAILABLE = False
 
 
+# Engine under test: PlaywrightAutomation's default unless WP_BROWSER is set
+BROWSER_TYPE = os.getenv('WP_BROWSER', 'firefox')
+
+# One browser per worker thread (the sync API is bound to the thread that
+# started it); each test opens its own context on it
+_local = threading.local()
+
+# Chromium launched in the background by main() when WP_PREWARM=1 and
+# WP_BROWSER=chromium. Test threads attach to it over CDP, which is far
+# cheaper than a launch; CDP attach is Chromium-only, so Firefox runs
+# launch their own browsers.
+_prewarm_endpoint = None
+_prewarm_ready = threading.Event()
+_prewarm_ready.set()  # nothing to wait for unless _start_prewarm() runs
+_prewarm_shutdown = threading.Event()
+
+
+def _prewarm():
+    """Launch Chromium with a CDP port and keep it up until exit."""
+    global _prewarm_endpoint
+    playwright = None
+    try:
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+
+        playwright = sync_playwright().start()
+        browser = playwright.chromium.launch(
+            headless=True,
+            args=CHROMIUM_LAUNCH_ARGS + CHROMIUM_HEADLESS_ARGS + [f'--remote-debugging-port={port}']
+        )
+        _prewarm_endpoint = f'http://127.0.0.1:{port}'
+    except Exception as e:
+        print(f"⚠️  Browser prewarm failed, tests will launch their own: {e}")
+        if playwright:
+            playwright.stop()
+        return
+    finally:
+        _prewarm_ready.set()
+
+    # The sync API must close the browser from the thread that launched it
+    _prewarm_shutdown.wait()
+    browser.close()
+    playwright.stop()
+
+
+def _stop_prewarm(thread):
+    """Close the prewarmed browser at exit."""
+    _prewarm_shutdown.set()
+    thread.join(timeout=10)
+
+
+def _start_prewarm():
+    """Start the background browser if WP_PREWARM=1 (off by default)."""
+    if os.getenv('WP_PREWARM', '0') != '1':
+        return
+    if BROWSER_TYPE != 'chromium':
+        print(f"ℹ️  WP_PREWARM ignored: CDP attach needs chromium, not {BROWSER_TYPE}")
+        return
+    if PLAYWRIGHT_AVAILABLE:
+        _prewarm_ready.clear()
+        thread = threading.Thread(target=_prewarm, daemon=True)
+        thread.start()
+        atexit.register(_stop_prewarm, thread)
+
+
+def _get_browser():
+    """This thread's shared headless BROWSER_TYPE browser, prewarmed or launched on first use."""
+    if getattr(_local, 'browser', None) is None:
+        _local.playwright = sync_playwright().start()
+        _prewarm_ready.wait(timeout=30)
+        if _prewarm_endpoint:
+            _local.browser = _local.playwright.chromium.connect_over_cdp(_prewarm_endpoint)
+        else:
+            launch_options = {}
+            if BROWSER_TYPE == 'chromium':
+                launch_options['args'] = CHROMIUM_LAUNCH_ARGS + CHROMIUM_HEADLESS_ARGS
+            launcher = getattr(_local.playwright, BROWSER_TYPE)
+            _local.browser = launcher.launch(headless=True, **launch_options)
+    return _local.browser
+
+
+def _close_browser():
+    """Close (or disconnect from) this thread's shared browser, if any."""
+    if getattr(_local, 'browser', None) is not None:
+        _local.browser.close()
+        _local.playwright.stop()
+        _local.browser = None
+
+
+class _ThreadOutput:
+    """stdout that sends each test thread's prints to that thread's buffer."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, text):
+        return getattr(_local, 'output', self.stream).write(text)
+
+    def flush(self):
+        getattr(_local, 'output', self.stream).flush()
+
+
+def _run_buffered(test):
+    """Run one test on the current thread, returning (result, its output)."""
+    _local.output = io.StringIO()
+    try:
+        return test(), _local.output.getvalue()
+    except Exception as e:
+        return False, _local.output.getvalue() + f"\n❌ {test.__name__} crashed: {e}\n"
+    finally:
+        _close_browser()
+        del _local.output
+
+
+async def _run_concurrently(tests):
+    """Run tests on worker threads at once; output is printed in order."""
+    real_stdout = sys.stdout
+    sys.stdout = _ThreadOutput(real_stdout)
+    try:
+        outcomes = await asyncio.gather(
+            *(asyncio.to_thread(_run_buffered, test) for test in tests.values())
+        )
+    finally:
+        sys.stdout = real_stdout
+
+    results = {}
+    for name, (result, output) in zip(tests, outcomes):
+        print(output, end='')
+        results[name] = result
+    return results
+
+
 def test_playwright_basic():
     """Test basic Playwright functionality."""
     print("\n" + "="*60)
@@ -35,7 +178,7 @@ def test_playwright_basic():
         return False
 
     try:
-        with PlaywrightAutomation(headless=True) as browser:
+        with PlaywrightAutomation(browser=_get_browser()) as browser:
             # Test navigation
             print("  1. Testing navigation...")
             assert browser.navigate("example.com"), "Navigation failed"
@@ -115,8 +258,47 @@ def test_webpilot_unified():
         return False
 
 
-def benchmark_comparison():
-    """Compare performance: Selenium vs Playwright."""
+async def _one_run(browser, url: str, i: int) -> float:
+    """One benchmark iteration in a fresh context; returns elapsed seconds."""
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    context = await browser.new_context(viewport={'width': 1366, 'height': 768})
+    try:
+        page = await context.new_page()
+        await page.goto(f"https://{url}", wait_until='domcontentloaded')
+        await page.title()
+        Path("screenshots").mkdir(exist_ok=True)
+        await page.screenshot(path=f"screenshots/benchmark_pw_{i}.png")
+    finally:
+        await context.close()
+    return loop.time() - start
+
+
+async def _benchmark_playwright_concurrent(url: str, iterations: int) -> list:
+    """Launch one browser and run all iterations on it at once."""
+    async with async_playwright() as p:
+        browser = await getattr(p, BROWSER_TYPE).launch(headless=True)
+        try:
+            return await asyncio.gather(
+                *(_one_run(browser, url, i) for i in range(iterations))
+            )
+        finally:
+            await browser.close()
+
+
+def benchmark_comparison(cold: bool = False):
+    """
+    Compare performance: Selenium vs Playwright.
+
+    By default one browser is launched up front and all Playwright
+    iterations run concurrently, each in its own context, while Selenium
+    reuses one driver sequentially. With cold=True (--cold) iterations of
+    both run one after another and each launches its own browser.
+
+    Per-run times taken under concurrency are not comparable with
+    sequential ones, so the two are compared on total wall-clock time for
+    the same number of runs, browser launch included.
+    """
     print("\n" + "="*60)
     print("TEST 3: Performance Comparison")
     print("="*60)
@@ -129,56 +311,83 @@ def benchmark_comparison():
     iterations = 3
 
     # Benchmark Playwright
-    print(f"\n📊 Benchmarking Playwright ({iterations} iterations)...")
+    pw_mode = "sequential, cold start" if cold else "concurrent, shared browser"
+    print(f"\n📊 Benchmarking Playwright ({iterations} iterations, {pw_mode})...")
     playwright_times = []
 
-    for i in range(iterations):
-        start = time.time()
-        with PlaywrightAutomation(headless=True) as browser:
-            browser.navigate(url)
-            browser.get_title()
-            browser.screenshot(f"benchmark_pw_{i}")
-        elapsed = time.time() - start
-        playwright_times.append(elapsed)
-        print(f"  Run {i+1}: {elapsed:.2f}s")
+    pw_start = time.time()
+    if cold:
+        for i in range(iterations):
+            start = time.time()
+            with PlaywrightAutomation(headless=True) as browser:
+                browser.navigate(url)
+                browser.get_title()
+                browser.screenshot(f"benchmark_pw_{i}")
+            elapsed = time.time() - start
+            playwright_times.append(elapsed)
+            print(f"  Run {i+1}: {elapsed:.2f}s")
+    else:
+        playwright_times = asyncio.run(_benchmark_playwright_concurrent(url, iterations))
+        for i, elapsed in enumerate(playwright_times):
+            print(f"  Run {i+1}: {elapsed:.2f}s (overlapping)")
+    pw_wall = time.time() - pw_start
 
-    pw_avg = sum(playwright_times) / len(playwright_times)
-    print(f"\n  Average Playwright time: {pw_avg:.2f}s")
+    print(f"\n  Playwright wall clock for {iterations} runs: {pw_wall:.2f}s")
 
     # Benchmark Selenium (if available)
     if SELENIUM_AVAILABLE:
-        print(f"\n📊 Benchmarking Selenium ({iterations} iterations)...")
+        sel_mode = "sequential, cold start" if cold else "sequential, shared driver"
+        print(f"\n📊 Benchmarking Selenium ({iterations} iterations, {sel_mode})...")
         selenium_times = []
 
+        sel_start = time.time()
+
+        # One driver reused unless --cold
+        shared_driver = None
+        if not cold:
+            shared_driver = SeleniumAutomation(headless=True)
+            if not shared_driver.start():
+                shared_driver = None
+
         for i in range(iterations):
             start = time.time()
             try:
-                browser = SeleniumAutomation(headless=True)
-                browser.start()
+                if shared_driver:
+                    browser = shared_driver
+                    browser.driver.delete_all_cookies()
+                else:
+                    browser = SeleniumAutomation(headless=True)
+                    browser.start()
                 browser.navigate(url)
                 browser.screenshot(f"benchmark_sel_{i}")
-                browser.close()
+                if not shared_driver:
+                    browser.close()
                 elapsed = time.time() - start
                 selenium_times.append(elapsed)
                 print(f"  Run {i+1}: {elapsed:.2f}s")
             except Exception as e:
                 print(f"  Run {i+1}: FAILED - {e}")
 
-        if selenium_times:
-            sel_avg = sum(selenium_times) / len(selenium_times)
-            print(f"\n  Average Selenium time: {sel_avg:.2f}s")
+        if shared_driver:
+            shared_driver.close()
+        sel_wall = time.time() - sel_start
+
+        if len(selenium_times) == iterations:
+            print(f"\n  Selenium wall clock for {iterations} runs: {sel_wall:.2f}s")
 
             # Compare
-            improvement = ((sel_avg - pw_avg) / sel_avg) * 100
-            print(f"\n🚀 PERFORMANCE RESULT:")
-            print(f"  Playwright: {pw_avg:.2f}s")
-            print(f"  Selenium:   {sel_avg:.2f}s")
-            print(f"  Improvement: {improvement:.1f}% faster with Playwright!")
+            improvement = ((sel_wall - pw_wall) / sel_wall) * 100
+            print(f"\n🚀 PERFORMANCE RESULT (wall clock, {iterations} runs each):")
+            print(f"  Playwright ({pw_mode}): {pw_wall:.2f}s")
+            print(f"  Selenium ({sel_mode}):   {sel_wall:.2f}s")
+            print(f"  Total time: {improvement:.1f}% less with Playwright")
 
             return True
+
+        print(f"\nℹ️  Only {len(selenium_times)}/{iterations} Selenium runs completed, no comparison made")
     else:
         print("\nℹ️  Selenium not available for comparison")
-        print(f"   Playwright time: {pw_avg:.2f}s")
+        print(f"   Playwright wall clock: {pw_wall:.2f}s")
 
     return True
 
@@ -202,7 +411,7 @@ def test_backward_compatibility():
 
         # Test that it works
         print("  2. Testing functionality...")
-        with RealBrowserAutomation(headless=True) as browser:
+        with RealBrowserAutomation(browser=_get_browser()) as browser:
             success = browser.navigate("example.com")
             assert success, "Navigation failed"
             title = browser.get_title()
@@ -230,7 +439,7 @@ def test_playwright_advantages():
         return False
 
     try:
-        with PlaywrightAutomation(headless=True) as browser:
+        with PlaywrightAutomation(browser=_get_browser()) as browser:
             # Feature 1: Network logging
             print("  1. Testing network logging...")
             browser.enable_network_logging()
@@ -278,13 +487,18 @@ def main():
     print("🚀 PLAYWRIGHT MIGRATION TEST SUITE")
     print("="*60)
 
-    results = {
-        'playwright_basic': test_playwright_basic(),
-        'webpilot_unified': test_webpilot_unified(),
-        'performance_comparison': benchmark_comparison(),
-        'backward_compatibility': test_backward_compatibility(),
-        'playwright_advantages': test_playwright_advantages()
-    }
+    _start_prewarm()
+
+    # The functional tests are independent, so they run side by side
+    results = asyncio.run(_run_concurrently({
+        'playwright_basic': test_playwright_basic,
+        'webpilot_unified': test_webpilot_unified,
+        'backward_compatibility': test_backward_compatibility,
+        'playwright_advantages': test_playwright_advantages,
+    }))
+
+    # The benchmark runs alone so other tests don't skew its timings
+    results['performance_comparison'] = benchmark_comparison(cold='--cold' in sys.argv)
 
     # Summary
     print("\n" + "="*60)
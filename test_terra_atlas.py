@@ -6,30 +6,139 @@ Tests the live Terra Atlas platform at atlas.luminousdynamics.io
 
 import asyncio
 import json
+import re
 from pathlib import Path
 from datetime import datetime
 import sys
 import os
+import threading
+import time
+from dataclasses import dataclass, field
+
+import aiohttp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.webpilot import WebPilot, WebPilotDevOps, AsyncWebPilot
+from src.webpilot import WebPilot, WebPilotDevOps
 from src.webpilot.backends.selenium import SeleniumWebPilot
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+
+# Markers looked for in the raw homepage HTML, matched without decoding it.
+# Only the start of the page is scanned: the <head> and app shell are enough.
+_MARKER_SCAN_BYTES = 4096
+_CONTENT_MARKERS = re.compile(rb'(globe|canvas|projects|h1|meta)', re.IGNORECASE)
+
+
+@dataclass
+class FetchResult:
+    """Outcome of one HTTP fetch"""
+    success: bool
+    data: dict = field(default_factory=dict)
+    duration_ms: float = 0.0
+    error: str = None
+
+
+class HttpPilot:
+    """
+    Plain HTTP fetcher for status and content checks.
+    
+    Availability and API checks need no JavaScript, so they go over one
+    pooled aiohttp session instead of a browser context per request.
+    """
+    
+    def __init__(self, timeout: float = 10, session=None):
+        """
+        Args:
+            timeout: Total seconds allowed per request
+            session: aiohttp session to share; it is left open on exit
+        """
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self._session = session
+        self._owns_session = session is None
+    
+    async def __aenter__(self):
+        if self._owns_session:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+            )
+        return self
+    
+    async def __aexit__(self, *exc):
+        if self._owns_session:
+            await self._session.close()
+    
+    async def fetch_content(self, url):
+        """GET a URL and report its status, size and a content preview"""
+        start = time.perf_counter_ns()
+        try:
+            async with self._session.get(url, timeout=self.timeout) as response:
+                body = await response.read()
+                return FetchResult(
+                    success=True,
+                    data={
+                        'status': response.status,
+                        'length': len(body),
+                        'raw': body,
+                        'content_preview': body[:2048].decode(
+                            response.get_encoding(), errors='replace'
+                        ),
+                    },
+                    duration_ms=(time.perf_counter_ns() - start) / 1e6
+                )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return FetchResult(
+                success=False,
+                duration_ms=(time.perf_counter_ns() - start) / 1e6,
+                error=str(e) or type(e).__name__
+            )
+    
+    async def batch_fetch(self, urls):
+        """Fetch several URLs concurrently"""
+        return await asyncio.gather(*(self.fetch_content(url) for url in urls))
+
+
+async def _parallel_fetch(pilot, urls):
+    """Fetch all URLs concurrently; failures come back as exception objects"""
+    return await asyncio.gather(
+        *(pilot.fetch_content(url) for url in urls),
+        return_exceptions=True
+    )
 
 
 class TerraAtlasTestSuite:
-    """Comprehensive test suite for Terra Atlas platform"""
+    """
+    Comprehensive test suite for Terra Atlas platform.
+    
+    Use as an async context manager: the HTTP checks share one keep-alive
+    session, opened on entry and closed on exit.
+    """
     
     def __init__(self):
         self.base_url = "https://atlas.luminousdynamics.io"
         self.devops = WebPilotDevOps(headless=True)
+        
+        # One timestamp for the whole run, shared by results and report name
+        self._run_ts = datetime.now()
+        self._run_tag = self._run_ts.strftime('%Y%m%d_%H%M%S')
+        
         self.results = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._run_ts.isoformat(),
             'site': 'Terra Atlas',
             'url': self.base_url,
             'tests': {}
         }
+        # The browser audits run on worker threads and all record results here
+        self._results_lock = threading.Lock()
         
         # Key pages to test
         self.key_pages = [
@@ -40,89 +149,123 @@ class TerraAtlasTestSuite:
             "/invest",  # Investment flow
         ]
         
+        # API endpoints to probe
+        self.api_endpoints = [
+            "/api/projects",
+            "/api/stats",
+            "/api/health"
+        ]
+        
+        # Full URLs, built once so every test sees the same base URL
+        self.page_urls = tuple(map(self.base_url.__add__, self.key_pages))
+        self.api_urls = tuple(map(self.base_url.__add__, self.api_endpoints))
+        
         # Create results directory
         self.results_dir = Path("terra-atlas-tests")
         self.results_dir.mkdir(exist_ok=True)
         
+        # Opened in __aenter__
+        self._session = None
+        self.pilot = None
+    
+    async def __aenter__(self):
+        # One connection pool (and DNS cache) for every HTTP check
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=50,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            )
+        )
+        self.pilot = HttpPilot(session=self._session)
+        return self
+    
+    async def __aexit__(self, *exc):
+        await self._session.close()
+    
     async def test_homepage_load(self):
         """Test homepage loads and 3D globe renders"""
         print("\n🌍 Testing Terra Atlas Homepage...")
         
-        async with AsyncWebPilot() as pilot:
-            result = await pilot.fetch_content(self.base_url)
+        result = await self.pilot.fetch_content(self.base_url)
+        
+        if result.success:
+            content_len = result.data.get('length', 0)
+            status = result.data.get('status', 0)
+            
+            # Check for key elements in one pass over the raw bytes
+            head = memoryview(result.data.get('raw', b''))[:_MARKER_SCAN_BYTES]
+            hits = {m.group(1).lower() for m in _CONTENT_MARKERS.finditer(head)}
+            has_globe = b'globe' in hits or b'canvas' in hits
+            has_projects = b'projects' in hits
+            
+            self.results['tests']['homepage'] = {
+                'success': True,
+                'status_code': status,
+                'content_size': content_len,
+                'has_3d_globe': has_globe,
+                'has_projects': has_projects,
+                'load_time_ms': result.duration_ms
+            }
             
-            if result.success:
-                content_len = result.data.get('length', 0)
+            print(f"   ✅ Homepage loaded successfully")
+            print(f"   Status: {status}")
+            print(f"   Size: {content_len:,} bytes")
+            print(f"   Load time: {result.duration_ms:.1f}ms")
+            print(f"   3D Globe: {'✅' if has_globe else '❌'}")
+            print(f"   Projects: {'✅' if has_projects else '❌'}")
+        else:
+            self.results['tests']['homepage'] = {
+                'success': False,
+                'error': result.error
+            }
+            print(f"   ❌ Homepage failed: {result.error}")
+    
+    async def test_page_availability(self):
+        """Test all key pages are accessible"""
+        print("\n📄 Testing Page Availability...")
+        
+        results = await _parallel_fetch(self.pilot, self.page_urls)
+        
+        page_results = {}
+        for page, result in zip(self.key_pages, results):
+            if isinstance(result, Exception):
+                page_results[page] = {
+                    'success': False,
+                    'error': str(result)
+                }
+                print(f"   ❌ {page}: {result}")
+            elif result.success:
                 status = result.data.get('status', 0)
-                
-                # Check for key elements
-                content = result.data.get('content_preview', '')
-                has_globe = 'globe' in content.lower() or 'canvas' in content.lower()
-                has_projects = 'projects' in content.lower()
-                
-                self.results['tests']['homepage'] = {
-                    'success': True,
-                    'status_code': status,
-                    'content_size': content_len,
-                    'has_3d_globe': has_globe,
-                    'has_projects': has_projects,
+                success = status == 200
+                page_results[page] = {
+                    'success': success,
+                    'status': status,
                     'load_time_ms': result.duration_ms
                 }
                 
-                print(f"   ✅ Homepage loaded successfully")
-                print(f"   Status: {status}")
-                print(f"   Size: {content_len:,} bytes")
-                print(f"   Load time: {result.duration_ms:.1f}ms")
-                print(f"   3D Globe: {'✅' if has_globe else '❌'}")
-                print(f"   Projects: {'✅' if has_projects else '❌'}")
+                icon = '✅' if success else '❌'
+                print(f"   {icon} {page}: {status} ({result.duration_ms:.0f}ms)")
             else:
-                self.results['tests']['homepage'] = {
+                page_results[page] = {
                     'success': False,
                     'error': result.error
                 }
-                print(f"   ❌ Homepage failed: {result.error}")
-    
-    async def test_page_availability(self):
-        """Test all key pages are accessible"""
-        print("\n📄 Testing Page Availability...")
+                print(f"   ❌ {page}: {result.error}")
         
-        urls = [self.base_url + page for page in self.key_pages]
-        
-        async with AsyncWebPilot() as pilot:
-            results = await pilot.batch_fetch(urls)
-            
-            page_results = {}
-            for page, result in zip(self.key_pages, results):
-                if result.success:
-                    status = result.data.get('status', 0)
-                    success = status == 200
-                    page_results[page] = {
-                        'success': success,
-                        'status': status,
-                        'load_time_ms': result.duration_ms
-                    }
-                    
-                    icon = '✅' if success else '❌'
-                    print(f"   {icon} {page}: {status} ({result.duration_ms:.0f}ms)")
-                else:
-                    page_results[page] = {
-                        'success': False,
-                        'error': result.error
-                    }
-                    print(f"   ❌ {page}: {result.error}")
-            
-            self.results['tests']['page_availability'] = page_results
+        self.results['tests']['page_availability'] = page_results
     
-    def test_performance(self):
+    def test_performance(self, devops=None):
         """Test performance metrics"""
         print("\n⚡ Testing Performance Metrics...")
         
-        perf = self.devops.performance_audit(self.base_url)
+        perf = (devops or self.devops).performance_audit(self.base_url)
         
         if perf:
             # Evaluate performance
             scores = {
-                'load_time': 100 if perf.load_time_ms < 3000 else 
+                'load_time': 100 if perf.load_time_ms < 3000 else
                             70 if perf.load_time_ms < 5000 else 40,
                 'fcp': 100 if perf.first_contentful_paint_ms < 1800 else
                        70 if perf.first_contentful_paint_ms < 3000 else 40,
@@ -132,12 +275,13 @@ class TerraAtlasTestSuite:
             
             overall_score = sum(scores.values()) / len(scores)
             
-            self.results['tests']['performance'] = {
-                'success': True,
-                'metrics': perf.to_dict(),
-                'scores': scores,
-                'overall_score': overall_score
-            }
+            with self._results_lock:
+                self.results['tests']['performance'] = {
+                    'success': True,
+                    'metrics': perf.to_dict(),
+                    'scores': scores,
+                    'overall_score': overall_score
+                }
             
             print(f"   Overall Score: {overall_score:.0f}/100")
             print(f"   • Load Time: {perf.load_time_ms:.0f}ms (Score: {scores['load_time']})")
@@ -146,24 +290,26 @@ class TerraAtlasTestSuite:
             print(f"   • Total Size: {perf.total_size_bytes:,} bytes")
             print(f"   • Requests: {perf.num_requests}")
         else:
-            self.results['tests']['performance'] = {
-                'success': False,
-                'error': 'Performance audit failed'
-            }
+            with self._results_lock:
+                self.results['tests']['performance'] = {
+                    'success': False,
+                    'error': 'Performance audit failed'
+                }
             print("   ❌ Performance audit failed")
     
-    def test_accessibility(self):
+    def test_accessibility(self, devops=None):
         """Test accessibility compliance"""
         print("\n♿ Testing Accessibility...")
         
-        a11y = self.devops.accessibility_check(self.base_url)
+        a11y = (devops or self.devops).accessibility_check(self.base_url)
         
-        self.results['tests']['accessibility'] = {
-            'success': a11y.passed,
-            'score': a11y.score,
-            'issues': a11y.issues,
-            'warnings': a11y.warnings
-        }
+        with self._results_lock:
+            self.results['tests']['accessibility'] = {
+                'success': a11y.passed,
+                'score': a11y.score,
+                'issues': a11y.issues,
+                'warnings': a11y.warnings
+            }
         
         print(f"   Score: {a11y.score}/100 {'✅' if a11y.passed else '❌'}")
         
@@ -175,14 +321,15 @@ class TerraAtlasTestSuite:
         if a11y.warnings:
             print(f"   Warnings: {len(a11y.warnings)}")
     
-    def test_seo(self):
+    def test_seo(self, devops=None):
         """Test SEO optimization"""
         print("\n🔍 Testing SEO...")
         
-        seo = self.devops.seo_audit(self.base_url)
+        seo = (devops or self.devops).seo_audit(self.base_url)
         
         if seo:
-            self.results['tests']['seo'] = seo
+            with self._results_lock:
+                self.results['tests']['seo'] = seo
             
             score = seo.get('score', 0)
             print(f"   SEO Score: {score}/100 {'✅' if score >= 80 else '⚠️' if score >= 60 else '❌'}")
@@ -212,17 +359,37 @@ class TerraAtlasTestSuite:
         baselines_dir = self.results_dir / "baselines"
         baselines_dir.mkdir(exist_ok=True)
         
+        # Element that shows each page has rendered
+        ready_selectors = {
+            'home': 'canvas',
+            'explore': 'canvas, main',
+            'projects': 'main, #app',
+        }
+        
         with SeleniumWebPilot(headless=True) as pilot:
-            for page in self.key_pages[:3]:  # Test first 3 pages
-                url = self.base_url + page
+            # Test first 3 pages
+            for i, (page, url) in enumerate(zip(self.key_pages[:3], self.page_urls)):
                 page_name = page.replace('/', 'home') if page == '/' else page.replace('/', '')
                 
                 print(f"   Capturing {page_name}...")
-                pilot.start(url)
+                # Start the driver once; later pages reuse it
+                if i == 0:
+                    pilot.start(url)
+                else:
+                    pilot.navigate(url)
                 
-                # Wait for page to load
-                import time
-                time.sleep(3)
+                # Wait for the page's content instead of a flat 3s
+                selector = ready_selectors.get(page_name, 'main, #app, body')
+                try:
+                    WebDriverWait(pilot.driver, 5).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+                    )
+                except TimeoutException:
+                    print(f"     ⚠️  '{selector}' not found after 5s, capturing anyway")
+                
+                # Short settle so the 3D globe draws its first frames
+                if page_name == 'home':
+                    time.sleep(0.5)
                 
                 # Take screenshot
                 screenshot_path = baselines_dir / f"{page_name}_baseline.png"
@@ -237,27 +404,21 @@ class TerraAtlasTestSuite:
         """Test API endpoints if available"""
         print("\n🔌 Testing API Endpoints...")
         
-        api_endpoints = [
-            "/api/projects",
-            "/api/stats",
-            "/api/health"
-        ]
+        results = await _parallel_fetch(self.pilot, self.api_urls)
         
-        async with AsyncWebPilot() as pilot:
-            for endpoint in api_endpoints:
-                url = self.base_url + endpoint
-                result = await pilot.fetch_content(url)
-                
-                if result.success:
-                    status = result.data.get('status', 0)
-                    if status == 200:
-                        print(f"   ✅ {endpoint}: {status}")
-                    elif status == 404:
-                        print(f"   ⚠️ {endpoint}: Not found (might not be implemented)")
-                    else:
-                        print(f"   ❌ {endpoint}: {status}")
+        for endpoint, result in zip(self.api_endpoints, results):
+            if isinstance(result, Exception):
+                print(f"   ❌ {endpoint}: {result}")
+            elif result.success:
+                status = result.data.get('status', 0)
+                if status == 200:
+                    print(f"   ✅ {endpoint}: {status}")
+                elif status == 404:
+                    print(f"   ⚠️ {endpoint}: Not found (might not be implemented)")
                 else:
-                    print(f"   ❌ {endpoint}: {result.error}")
+                    print(f"   ❌ {endpoint}: {status}")
+            else:
+                print(f"   ❌ {endpoint}: {result.error}")
     
     def generate_report(self):
         """Generate comprehensive test report"""
@@ -276,9 +437,17 @@ class TerraAtlasTestSuite:
         }
         
         # Save JSON report
-        report_path = self.results_dir / f"terra_atlas_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_path, 'w') as f:
-            json.dump(self.results, f, indent=2, default=str)
+        report_path = self.results_dir / f"terra_atlas_report_{self._run_tag}.json"
+        if orjson:
+            with open(report_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    self.results,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            with open(report_path, 'w') as f:
+                json.dump(self.results, f, indent=2, default=str)
         
         print(f"   ✅ Report saved: {report_path}")
         
@@ -317,7 +486,7 @@ class TerraAtlasTestSuite:
         print("\n🚀 TERRA ATLAS COMPREHENSIVE TEST SUITE")
         print("=" * 60)
         print(f"Testing: {self.base_url}")
-        print(f"Time: {datetime.now().isoformat()}")
+        print(f"Time: {self.results['timestamp']}")
         print("=" * 60)
         
         # Run async tests
@@ -325,10 +494,15 @@ class TerraAtlasTestSuite:
         await self.test_page_availability()
         await self.test_api_endpoints()
         
-        # Run sync tests
+        # Performance runs alone so other browsers don't skew its timings
         self.test_performance()
-        self.test_accessibility()
-        self.test_seo()
+        
+        # Accessibility and SEO run concurrently, each with its own
+        # WebPilotDevOps (and browser) so no driver is shared across threads
+        await asyncio.gather(
+            asyncio.to_thread(self.test_accessibility, WebPilotDevOps(headless=True)),
+            asyncio.to_thread(self.test_seo, WebPilotDevOps(headless=True)),
+        )
         self.test_visual_baseline()
         
         # Generate report
@@ -339,8 +513,8 @@ class TerraAtlasTestSuite:
 
 async def main():
     """Run Terra Atlas tests"""
-    suite = TerraAtlasTestSuite()
-    report_path = await suite.run_all_tests()
+    async with TerraAtlasTestSuite() as suite:
+        report_path = await suite.run_all_tests()
     
     print(f"\n✨ Testing complete! Report: {report_path}")
     print("\nNext steps:")
@@ -0,0 +1,117 @@
+"""
+Shared fixtures for the WebPilot test suite.
+"""
+
+import json
+import pytest
+from pytest_asyncio import is_async_test
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from webpilot.intelligence.visual_intelligence import VisualAnalysis, VisualElement
+from webpilot.intelligence.autonomous_agent import AutonomousAgent, TaskPlan, TaskStep
+from webpilot.testing.natural_language_tests import (
+    NaturalLanguageTestGenerator,
+    TestFramework,
+    Language
+)
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on one session-wide event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture
+def stub_image_open(monkeypatch):
+    """Make Image.open in visual_intelligence return a 1920x1080 stub image."""
+    stub = Mock(return_value=SimpleNamespace(size=(1920, 1080)))
+    monkeypatch.setattr('webpilot.intelligence.visual_intelligence.Image.open', stub)
+    return stub
+
+
+@pytest.fixture
+def patched_webpilot(monkeypatch):
+    """Replace WebPilot in the intelligence modules for one test."""
+    mock_webpilot = Mock()
+    monkeypatch.setattr('webpilot.intelligence.visual_intelligence.WebPilot', mock_webpilot)
+    monkeypatch.setattr('webpilot.intelligence.autonomous_agent.WebPilot', mock_webpilot)
+    return mock_webpilot
+
+
+@pytest.fixture
+def openai_client():
+    """OpenAI client fake whose create() returns one navigate function call."""
+    client = Mock()
+    client.chat.completions.create.return_value = SimpleNamespace(choices=[
+        SimpleNamespace(message=SimpleNamespace(function_call=SimpleNamespace(
+            name="navigate",
+            arguments=json.dumps({"url": "https://example.com"})
+        )))
+    ])
+    return client
+
+
+@pytest.fixture(scope="module")
+def nl_generator():
+    """pytest/Python test generator, built once per module."""
+    return NaturalLanguageTestGenerator(TestFramework.PYTEST, Language.PYTHON)
+
+
+@pytest.fixture(scope="module")
+def jest_generator():
+    """Jest/JavaScript test generator, built once per module."""
+    return NaturalLanguageTestGenerator(TestFramework.JEST, Language.JAVASCRIPT)
+
+
+@pytest.fixture
+def agent():
+    """Fresh AutonomousAgent with default settings."""
+    return AutonomousAgent()
+
+
+@pytest.fixture
+def visual_agent():
+    """Fresh AutonomousAgent that falls back to visual recognition."""
+    return AutonomousAgent(enable_visual_fallback=True)
+
+
+@pytest.fixture(scope="module")
+def navigation_plan():
+    """One-step plan that navigates to example.com (deepcopy before running)."""
+    return TaskPlan(
+        goal="test navigation",
+        steps=[
+            TaskStep(
+                action="navigate",
+                arguments={"url": "https://example.com"},
+                description="Go to example.com"
+            )
+        ]
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_analysis():
+    """Visual analysis of a page with a single Submit button (read-only)."""
+    return VisualAnalysis(
+        elements=[
+            VisualElement(
+                type="button",
+                text="Submit",
+                location=(100, 200),
+                size=(80, 30),
+                confidence=0.95,
+                attributes={}
+            )
+        ],
+        layout="standard",
+        primary_content="form",
+        navigation=[],
+        forms=[],
+        images=[],
+        overall_description="Page with submit button"
+    )
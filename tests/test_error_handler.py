@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+Tests for the async retry decorator in webpilot.utils.error_handler.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from webpilot.utils import error_handler
+from webpilot.utils.error_handler import async_retry
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def fake_sleep(monkeypatch):
+    """Record backoff waits instead of sleeping."""
+    sleep = AsyncMock()
+    monkeypatch.setattr(error_handler.asyncio, 'sleep', sleep)
+    return sleep
+
+
+def _flaky(failures, exc=ConnectionError):
+    """Coroutine mock that raises ``exc`` ``failures`` times, then returns 'ok'."""
+    return AsyncMock(side_effect=[exc(f"fail {i}") for i in range(failures)] + ["ok"])
+
+
+class TestAsyncRetry:
+    """Test async_retry behaviour."""
+    
+    async def test_success_after_failures(self, fake_sleep):
+        """Test a call that succeeds once earlier attempts have failed."""
+        func = _flaky(2)
+        on_retry = []
+        wrapped = async_retry(
+            max_attempts=3, delay=0.5, on_retry=lambda n, e: on_retry.append(n)
+        )(func)
+        
+        assert await wrapped("a", key="b") == "ok"
+        assert func.await_count == 3
+        func.assert_awaited_with("a", key="b")
+        assert on_retry == [1, 2]
+    
+    async def test_reraises_after_final_attempt(self, fake_sleep):
+        """Test the last error is raised once attempts run out."""
+        func = _flaky(3)
+        wrapped = async_retry(max_attempts=3, delay=0.1)(func)
+        
+        with pytest.raises(ConnectionError, match="fail 2"):
+            await wrapped()
+        assert func.await_count == 3
+    
+    async def test_backoff_schedule(self, fake_sleep):
+        """Test waits follow delay * backoff ** n between attempts."""
+        wrapped = async_retry(max_attempts=4, delay=0.5, backoff=3.0)(_flaky(3))
+        
+        assert await wrapped() == "ok"
+        assert [c.args[0] for c in fake_sleep.await_args_list] == [0.5, 1.5, 4.5]
+    
+    async def test_unlisted_exception_not_retried(self, fake_sleep):
+        """Test exceptions outside ``exceptions`` propagate immediately."""
+        func = _flaky(1, exc=KeyError)
+        wrapped = async_retry(max_attempts=3, exceptions=(ConnectionError,))(func)
+        
+        with pytest.raises(KeyError):
+            await wrapped()
+        assert func.await_count == 1
+        fake_sleep.assert_not_awaited()